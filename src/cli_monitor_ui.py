@@ -13,18 +13,30 @@
         --file-path /path/to/Task1_Feature.md \\
         --file-path /path/to/Task2_Feature.md \\
         --tool-name "ToolName"
+
+常驻模式（跨审查复用同一进程）：
+    python -m src.cli_monitor_ui --server
+
+    从stdin逐行读取JSON命令，向stdout逐行写入JSON消息：
+    - {"command": "show", "log_path": ..., "file_paths": [...], "tool_name": ...}
+      显示新的监控窗口，回复 {"status": "ready"}
+    - {"command": "close"}  关闭当前窗口（不弹出确认）
+    - stdin关闭时退出进程
+    用户中止审查时写出 {"event": "aborted"}（替代退出码99）
 """
 
 import sys
+import json
 import argparse
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Callable
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QPushButton, QLabel, QMessageBox
 )
-from PySide6.QtCore import Qt, QTimer, QUrl
+from PySide6.QtCore import Qt, QTimer, QUrl, QObject, Signal
 from PySide6.QtGui import QPalette, QColor, QTextCursor, QDesktopServices, QCloseEvent
 
 try:
@@ -81,7 +93,8 @@ class CliMonitorWindow(QMainWindow):
         self,
         log_path: str,
         file_paths: List[str],
-        tool_name: str = "Codex"
+        tool_name: str = "Codex",
+        on_abort: Optional[Callable[[], None]] = None
     ) -> None:
         """初始化监控窗口
 
@@ -89,6 +102,7 @@ class CliMonitorWindow(QMainWindow):
             log_path: 日志文件的绝对路径
             file_paths: 要监控的文件路径列表（ReviewIndex.md和Task*.md）
             tool_name: CLI工具显示名称（默认为Codex）
+            on_abort: 用户中止审查时的回调（常驻模式使用）；为None时以退出码99退出进程
         """
         super().__init__()
 
@@ -96,6 +110,10 @@ class CliMonitorWindow(QMainWindow):
         self.log_path = Path(log_path)
         self.file_paths = [Path(p) for p in file_paths]
         self.tool_name = tool_name
+        self.on_abort = on_abort
+
+        # 是否跳过关闭确认（由MCP主动关闭窗口时为True）
+        self._force_close = False
 
         # 日志读取状态
         self.last_log_size = 0  # 上次读取的文件大小（用于增量读取）
@@ -301,11 +319,23 @@ class CliMonitorWindow(QMainWindow):
         )
         return reply == QMessageBox.Yes
 
+    def _notify_abort(self) -> None:
+        """通知MCP用户中止审查（常驻模式调用回调，否则使用特殊退出码99）"""
+        if self.on_abort is None:
+            sys.exit(99)
+        self.on_abort()
+
+    def close_without_confirm(self) -> None:
+        """关闭窗口且不弹出确认对话框（由MCP主动关闭时使用）"""
+        self._force_close = True
+        self.close()
+
     def _on_exit_clicked(self) -> None:
         """处理退出按钮点击事件（显示确认对话框）"""
         if self._confirm_exit():
-            # 用户确认退出，使用特殊退出码99通知MCP
-            sys.exit(99)
+            # 用户确认退出，通知MCP
+            self._notify_abort()
+            self.close_without_confirm()
 
     def _on_view_clicked(self) -> None:
         """处理查看按钮点击事件（显示CLI工具配置预览）"""
@@ -404,20 +434,90 @@ class CliMonitorWindow(QMainWindow):
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """窗口关闭事件（用户点击X按钮或通过其他方式关闭窗口）"""
-        if self._confirm_exit():
-            # 停止定时器
-            self.log_timer.stop()
-
-            # 关闭预览窗口（如果存在）
-            if self.preview_window and not self.preview_window.isHidden():
-                self.preview_window.close()
-
-            # 接受关闭事件，使用特殊退出码
-            event.accept()
-            sys.exit(99)
-        else:
+        if not self._force_close and not self._confirm_exit():
             # 忽略关闭事件
             event.ignore()
+            return
+
+        # 停止定时器
+        self.log_timer.stop()
+
+        # 关闭预览窗口（如果存在）
+        if self.preview_window and not self.preview_window.isHidden():
+            self.preview_window.close()
+
+        # 接受关闭事件
+        event.accept()
+
+        if not self._force_close:
+            # 用户确认退出，通知MCP
+            self._notify_abort()
+
+
+class MonitorUiServer(QObject):
+    """常驻监控UI服务：从stdin读取JSON命令，在同一进程中为多次审查显示监控窗口"""
+
+    # stdin读取线程通过信号把命令交给Qt主线程处理
+    command_received = Signal(str)
+
+    def __init__(self, app: QApplication) -> None:
+        """初始化常驻服务并启动stdin读取线程
+
+        Args:
+            app: QApplication实例
+        """
+        super().__init__()
+        self.app = app
+        self.window: Optional[CliMonitorWindow] = None
+
+        self.command_received.connect(self._handle_command)
+
+        reader = threading.Thread(target=self._read_stdin, daemon=True)
+        reader.start()
+
+    def _read_stdin(self) -> None:
+        """读取stdin中的命令（后台线程），stdin关闭时请求退出"""
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                self.command_received.emit(line)
+        self.command_received.emit(json.dumps({"command": "quit"}))
+
+    def _send(self, message: dict) -> None:
+        """向MCP写出一行JSON消息"""
+        print(json.dumps(message), flush=True)
+
+    def _close_window(self) -> None:
+        """关闭当前监控窗口（不弹出确认）"""
+        if self.window is not None:
+            self.window.close_without_confirm()
+            self.window = None
+
+    def _handle_command(self, line: str) -> None:
+        """处理一条JSON命令（Qt主线程）"""
+        try:
+            command = json.loads(line)
+        except json.JSONDecodeError:
+            return
+
+        action = command.get("command")
+        if action == "show":
+            self._close_window()
+            self.window = CliMonitorWindow(
+                log_path=command["log_path"],
+                file_paths=command.get("file_paths", []),
+                tool_name=command.get("tool_name", "Codex"),
+                on_abort=lambda: self._send({"event": "aborted"})
+            )
+            self.window.show()
+            self.window.raise_()
+            self.window.activateWindow()
+            self._send({"status": "ready"})
+        elif action == "close":
+            self._close_window()
+        elif action == "quit":
+            self._close_window()
+            self.app.quit()
 
 
 def main() -> None:
@@ -428,13 +528,11 @@ def main() -> None:
     )
     parser.add_argument(
         "--log-path",
-        required=True,
         help="Path to log file"
     )
     parser.add_argument(
         "--file-path",
         action="append",
-        required=True,
         help="Path to file (can be specified multiple times for ReviewIndex.md and Task*.md)"
     )
     parser.add_argument(
@@ -442,8 +540,16 @@ def main() -> None:
         default="Codex",
         help="CLI tool display name (default: Codex)"
     )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Run as a persistent monitor reading JSON commands from stdin"
+    )
     args = parser.parse_args()
 
+    if not args.server and (not args.log_path or not args.file_path):
+        parser.error("--log-path and --file-path are required unless --server is given")
+
     # 创建Qt应用
     app = QApplication(sys.argv)
 
@@ -451,6 +557,12 @@ def main() -> None:
     app.setPalette(get_dark_mode_palette(app))
     app.setStyle("Fusion")
 
+    if args.server:
+        # 常驻模式：关闭窗口不退出进程，由stdin关闭触发退出
+        app.setQuitOnLastWindowClosed(False)
+        server = MonitorUiServer(app)
+        sys.exit(app.exec())
+
     # 创建并显示窗口
     window = CliMonitorWindow(
         log_path=args.log_path,
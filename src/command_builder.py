@@ -48,20 +48,6 @@ class CommandBuilder:
 
         return [executable] + args + [prompt]
 
-    def build_review_command_string(self, session_rel_path: str) -> str:
-        """构建命令字符串（仅用于日志显示）
-        Build command string (for logging only)
-
-        Args:
-            session_rel_path: session目录相对于项目根的路径
-                            Session directory path relative to project root
-
-        Returns:
-            命令字符串 | Command string
-        """
-        args = self.build_review_command_args(session_rel_path)
-        return ' '.join(args)
-
     def get_version_check_args(self) -> List[str]:
         """获取版本检查参数列表 | Get version check arguments list
 
@@ -128,8 +114,8 @@ class CommandBuilder:
 
         if actual_length > max_length:
             logger.warning(
-                f"[CommandBuilder] Prompt length ({actual_length}) exceeds "
-                f"recommended limit ({max_length})"
+                f"[CommandBuilder] Prompt length ({actual_length} chars) exceeds "
+                f"recommended limit ({max_length} chars). This may cause issues."
             )
             return True
 
@@ -80,9 +80,28 @@ class EncodingDetector:
             >>> path = Path("review-request.md")
             >>> content = EncodingDetector.read_file(path, support_bom=True)
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # Read the file once, then decode the in-memory bytes
+        # (raises FileNotFoundError if the file does not exist)
+        data = file_path.read_bytes()
+        return EncodingDetector.decode_text(data, support_bom=support_bom, source=str(file_path))
 
+    @staticmethod
+    def decode_text(data: bytes, support_bom: bool = False, source: str = "<bytes>") -> str:
+        """严格模式解码已读入内存的文件内容（read_file的解码部分）。
+
+        与read_file相同的编码顺序、换行统一和BOM处理，供已持有文件字节的调用方避免重复读盘。
+
+        Args:
+            data: 文件的原始字节
+            support_bom: 如果为True，尝试UTF-8-BOM编码（默认：False）
+            source: 错误信息中使用的来源描述（通常为文件路径）
+
+        Returns:
+            解码后的文本（换行统一为\n，不含BOM）
+
+        Raises:
+            UnicodeDecodeError: 如果无法用任何支持的编码解码
+        """
         encodings = (EncodingDetector.ENCODINGS_WITH_BOM if support_bom
                     else EncodingDetector.STANDARD_ENCODINGS)
         last_error = None
@@ -90,7 +109,9 @@ class EncodingDetector:
         # Try each encoding in strict mode
         for encoding in encodings:
             try:
-                content = file_path.read_text(encoding=encoding)
+                content = data.decode(encoding)
+                # Universal newlines, same as read_text()
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
                 # Explicitly remove BOM if present (utf-8-sig should handle this but doesn't always)
                 if content and content[0] == '\ufeff':
                     content = content[1:]
@@ -105,6 +126,6 @@ class EncodingDetector:
             b'',
             0,
             1,
-            f"File {file_path} cannot be decoded with any of {encodings}. "
+            f"File {source} cannot be decoded with any of {encodings}. "
             f"Last error: {last_error}"
         )
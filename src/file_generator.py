@@ -1,7 +1,10 @@
 """CLI审查工作流的文件生成器。"""
 
+import codecs
 import json
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -17,6 +20,39 @@ try:
 except ImportError:
     from template import GENERIC_REVIEWER_TEMPLATE, REPORT_FORMAT_TEMPLATE
 
+# 模板在导入时预先按占位符切分（偶数下标为字面文本，奇数下标为占位符名），
+# 渲染时一次join完成，避免链式replace对整个文本的多次复制
+_REVIEWER_TEMPLATE_SEGMENTS = re.split(r'\{(SESSION_REL_PATH)\}', GENERIC_REVIEWER_TEMPLATE)
+_REPORT_FORMAT_SEGMENTS = re.split(r'\{\{(INITIATOR|REVIEWER)\}\}', REPORT_FORMAT_TEMPLATE)
+
+# ReviewIndex.md中的注入占位符（由客户端生成，无法预切分，使用单次re.sub）
+_INJECT_PATTERN = re.compile(r'\{\{INJECT:(REVIEWER_INSTRUCTIONS|REPORT_FORMAT)\}\}')
+
+
+def _render_segments(segments: List[str], values: dict) -> str:
+    """将预切分的模板片段与占位符值拼接为最终文本。
+
+    Args:
+        segments: re.split得到的片段列表（偶数下标为字面文本，奇数下标为占位符名）
+        values: 占位符名到替换值的映射
+
+    Returns:
+        渲染后的文本
+    """
+    return "".join(seg if i % 2 == 0 else values[seg] for i, seg in enumerate(segments))
+
+
+@lru_cache(maxsize=32)
+def _render_report_format(initiator: str, reviewer: str) -> str:
+    """渲染REPORT_FORMAT（发起者/审阅者组合很少，按组合缓存渲染结果）。
+
+    GENERIC_REVIEWER_TEMPLATE的SESSION_REL_PATH每个session都不同（带时间戳），缓存无命中，不做缓存。
+    """
+    return _render_segments(
+        _REPORT_FORMAT_SEGMENTS,
+        {'INITIATOR': initiator, 'REVIEWER': reviewer}
+    )
+
 
 class FileGenerator:
     """为CLI审查生成所有必需的文件。"""
@@ -63,17 +99,20 @@ class FileGenerator:
             替换占位符后的文本
         """
         # 替换GENERIC_REVIEWER_TEMPLATE中的路径占位符
-        reviewer_template = GENERIC_REVIEWER_TEMPLATE.replace('{SESSION_REL_PATH}', session_rel_path)
-        
-        text = text.replace('{{INJECT:REVIEWER_INSTRUCTIONS}}', reviewer_template)
+        reviewer_template = _render_segments(
+            _REVIEWER_TEMPLATE_SEGMENTS,
+            {'SESSION_REL_PATH': session_rel_path}
+        )
 
         # 替换REPORT_FORMAT，其中包含{{INITIATOR}}和{{REVIEWER}}占位符
-        report_format = REPORT_FORMAT_TEMPLATE
-        report_format = report_format.replace('{{INITIATOR}}', initiator or '未指定')
-        report_format = report_format.replace('{{REVIEWER}}', reviewer or '未指定')
+        report_format = _render_report_format(initiator or '未指定', reviewer or '未指定')
 
-        text = text.replace('{{INJECT:REPORT_FORMAT}}', report_format)
-        return text
+        # 单次扫描替换所有注入占位符
+        injections = {
+            'REVIEWER_INSTRUCTIONS': reviewer_template,
+            'REPORT_FORMAT': report_format,
+        }
+        return _INJECT_PATTERN.sub(lambda m: injections[m.group(1)], text)
 
     def copy_files_to_session(
         self,
@@ -142,12 +181,9 @@ class FileGenerator:
                 # 3.2 验证文件名格式
                 self._validate_task_filename(target_filename)
 
-                # 3.3 读取任务文件
-                task_text = EncodingDetector.read_file(temp_path_obj, support_bom=True)
-
-                # 3.4 写入会话目录
+                # 3.3 放入会话目录（统一为UTF-8无BOM）
                 task_file = self.session_dir / target_filename
-                task_file.write_text(task_text, encoding='utf-8')
+                self._move_to_session(temp_path_obj, task_file)
                 task_files.append(task_file)
 
             # 4. 处理OriginalRequirement.md（如果提供）
@@ -156,10 +192,7 @@ class FileGenerator:
                 temp_files_to_delete.append(orig_req_path)
 
                 orig_req_target = self._extract_target_filename(orig_req_path.name)
-                orig_req_text = EncodingDetector.read_file(orig_req_path, support_bom=True)
-
-                orig_req_file = self.session_dir / orig_req_target
-                orig_req_file.write_text(orig_req_text, encoding='utf-8')
+                self._move_to_session(orig_req_path, self.session_dir / orig_req_target)
 
             # 5. 处理TaskPlanning.md（如果提供）
             if task_planning_path:
@@ -167,10 +200,7 @@ class FileGenerator:
                 temp_files_to_delete.append(task_plan_path)
 
                 task_plan_target = self._extract_target_filename(task_plan_path.name)
-                task_plan_text = EncodingDetector.read_file(task_plan_path, support_bom=True)
-
-                task_plan_file = self.session_dir / task_plan_target
-                task_plan_file.write_text(task_plan_text, encoding='utf-8')
+                self._move_to_session(task_plan_path, self.session_dir / task_plan_target)
 
         finally:
             # 6. 清理所有临时文件（即使出错也要执行）
@@ -179,6 +209,38 @@ class FileGenerator:
 
         return review_file, task_files
 
+    def _move_to_session(self, temp_path: Path, target_path: Path) -> None:
+        """将临时文件放入会话目录，统一为UTF-8无BOM编码。
+
+        常见情况（已是UTF-8无BOM、LF换行）直接移动原文件，不做解码和重新编码；
+        否则智能检测编码后以UTF-8重新写入（临时文件随后由调用方删除）。
+
+        Args:
+            temp_path: 临时文件路径
+            target_path: 会话目录中的目标路径
+
+        Raises:
+            FileNotFoundError: 临时文件未找到
+            UnicodeDecodeError: 文件编码无法检测
+        """
+        data = temp_path.read_bytes()
+        if not data.startswith(codecs.BOM_UTF8) and b'\r' not in data:
+            try:
+                data.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+            else:
+                try:
+                    os.replace(temp_path, target_path)
+                except OSError:
+                    # 跨文件系统等情况无法移动，直接写入原始字节
+                    target_path.write_bytes(data)
+                return
+
+        # 解码已读入的字节（与read_file相同的编码顺序），不再重复读盘
+        text = EncodingDetector.decode_text(data, support_bom=True, source=str(temp_path))
+        target_path.write_text(text, encoding='utf-8')
+
     def _extract_target_filename(self, temp_filename: str) -> str:
         """从临时文件名提取目标文件名。
 
@@ -28,6 +28,26 @@ class ReportParser:
     _SUGGESTION_SECTION_PATTERN = re.compile(r'##\s*Improvement\s*Suggestions\s*\n(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
     _SUGGESTION_ITEM_PATTERN = re.compile(r'-\s*(.+)')
 
+    # 完整性标记位于报告末尾，只需检查尾部
+    _COMPLETION_MARKERS = ("<!-- REVIEW_COMPLETE -->", "---END_OF_REVIEW---")
+    COMPLETION_MARKER_TAIL_CHARS = 4096
+
+    @staticmethod
+    def has_completion_marker(report_content: str) -> bool:
+        """检查报告尾部是否包含完整性标记。
+
+        标记总是写在报告末尾，因此只扫描最后COMPLETION_MARKER_TAIL_CHARS个字符，
+        开销不随报告大小增长。
+
+        Args:
+            report_content: report.md的原始内容
+
+        Returns:
+            包含任一完整性标记时为True
+        """
+        tail = report_content[-ReportParser.COMPLETION_MARKER_TAIL_CHARS:]
+        return any(marker in tail for marker in ReportParser._COMPLETION_MARKERS)
+
     @staticmethod
     def parse_report(report_content: str) -> ParsedReport:
         """解析report.md内容为结构化数据。
@@ -38,7 +58,8 @@ class ReportParser:
         Returns:
             包含结构化数据的ParsedReport实例
         """
-        if not report_content or not report_content.strip():
+        # isspace()判断空白内容，不复制整个报告
+        if not report_content or report_content.isspace():
             return ParsedReport(
                 status="unknown",
                 issues=[],
@@ -47,10 +68,7 @@ class ReportParser:
             )
 
         # 1. 检查报告完整性标记
-        has_completion_marker = ("<!-- REVIEW_COMPLETE -->" in report_content or
-                                 "---END_OF_REVIEW---" in report_content)
-
-        if not has_completion_marker:
+        if not ReportParser.has_completion_marker(report_content):
             # 向后兼容：检查是否是旧版本完整报告
             has_conclusion = bool(ReportParser._SUMMARY_OR_CONCLUSION_PATTERN.search(report_content))
             report_length = len(report_content.strip())
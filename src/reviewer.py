@@ -6,9 +6,12 @@ import subprocess
 import sys
 import os
 import json
+import shlex
+import hashlib
 import logging
+import traceback
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # 配置logging输出到stderr（不影响MCP的stdout JSON通信）| Configure logging output to stderr (does not affect MCP stdout JSON communication)
 logging.basicConfig(
@@ -25,12 +28,40 @@ try:
     from .data_models import ReviewResult
     from .cli_config import get_current_config, load_config, update_current_cli_tool, get_default_config, get_user_config_path, create_config_file
     from .command_builder import CommandBuilder
+    from .report_parser import ReportParser
 except ImportError:
     from gui_utils import check_gui_available
     from encoding_utils import EncodingDetector
     from data_models import ReviewResult
     from cli_config import get_current_config, load_config, update_current_cli_tool, get_default_config, get_user_config_path, create_config_file
     from command_builder import CommandBuilder
+    from report_parser import ReportParser
+
+# 平台常量（模块加载时计算一次）| Platform constants (computed once at import)
+_IS_WINDOWS = sys.platform == 'win32'
+# Windows上通过cmd.exe运行CLI工具的命令前缀 | Command prefix for running CLI tools via cmd.exe on Windows
+_CMD_PREFIX = ('cmd.exe', '/c')
+
+# 错误报告模板（所有错误报告共用，模块加载时定义一次）| Error report template (shared by all error reports, defined once at import)
+_ERROR_REPORT_TEMPLATE = """# Review Report
+
+## Status
+{status}
+
+## Error Message
+{error_message}
+
+## Summary
+{summary}
+"""
+
+# 可选依赖：watchfiles（inotify/ReadDirectoryChangesW文件变化通知）| Optional dependency: watchfiles (inotify/ReadDirectoryChangesW change notifications)
+try:
+    from watchfiles import awatch
+    # 根logger为INFO级别，屏蔽watchfiles每批变化的"N change(s) detected"日志 | Root logger is at INFO; silence watchfiles' per-batch "N change(s) detected" logs
+    logging.getLogger("watchfiles").setLevel(logging.WARNING)
+except ImportError:
+    awatch = None
 
 
 class CliReviewer:
@@ -41,17 +72,58 @@ class CliReviewer:
     UI_STARTUP_CHECK_DELAY = 0.5
     PROCESS_TERMINATION_TIMEOUT = 3
     UI_TERMINATION_TIMEOUT = 2
+    UI_SERVER_READY_TIMEOUT = 15
     REPORT_DETECTION_WAIT_TIME = 10
     MAIN_LOOP_POLL_INTERVAL = 1
     LOG_TASK_CLEANUP_TIMEOUT = 5
 
     # File I/O constants
     LOG_FILE_LINE_BUFFERING = 1
+    LOG_TAIL_READ_BYTES = 64 * 1024
+    LOG_READ_CHUNK_SIZE = 64 * 1024  # CLI stdout读取块大小 | CLI stdout read chunk size
     REPORT_MIN_SIZE_BYTES = 100
 
+    # GUI可用性缓存（类级别，长时间运行的MCP进程中跨审查复用）| GUI availability cache (class level, reused across reviews in a long-running MCP process)
+    _gui_available_cache: Optional[bool] = None
+
+    # 常驻监控UI进程（类级别，跨审查复用）| Persistent monitor UI process (class level, reused across reviews)
+    _ui_server_process = None
+    _ui_server_busy = False
+
     def __init__(self):
         """初始化审查器 | Initialize reviewer"""
-        pass
+        # 上次构建command_builder时的配置摘要（用于重试时跳过重复构建）| Config digest of last command_builder build (skip rebuild on retry)
+        self._config_digest = None
+        # 最近一次写入日志的时间戳（由日志捕获任务更新，空闲看门狗读取）| Timestamp of last log write (updated by log capture task, read by idle watchdog)
+        self._last_log_write_ts = time.monotonic()
+
+    @classmethod
+    def _is_gui_available(cls) -> bool:
+        """检测GUI是否可用（结果缓存）| Check if GUI is available (result cached)
+
+        Returns:
+            bool: True表示支持GUI | True if GUI is supported
+        """
+        if cls._gui_available_cache is None:
+            cls._gui_available_cache = check_gui_available()
+        return cls._gui_available_cache
+
+    @classmethod
+    def clear_gui_cache(cls) -> None:
+        """清除GUI可用性缓存，下次检测时重新探测 | Clear GUI availability cache so the next check probes again"""
+        cls._gui_available_cache = None
+
+    @staticmethod
+    def _config_digest_of(config: Dict[str, Any]) -> bytes:
+        """计算配置字典的摘要 | Compute digest of configuration dict
+
+        Args:
+            config: CLI配置字典 | CLI configuration dict
+
+        Returns:
+            bytes: 配置摘要 | Configuration digest
+        """
+        return hashlib.blake2b(json.dumps(config, sort_keys=True).encode('utf-8')).digest()
 
     def _check_cli_installed(self, version_check_args: list, display_name: str) -> tuple[bool, str]:
         """检查CLI工具是否已安装并可用 | Check if CLI tool is installed and available
@@ -77,14 +149,12 @@ class CliReviewer:
         try:
             # 在Windows上使用shell=True以支持.cmd/.bat文件 | Use shell=True on Windows to support .cmd/.bat files
             # npm安装的CLI工具在Windows上通常是.cmd批处理文件 | npm-installed CLI tools on Windows are usually .cmd batch files
-            is_windows = sys.platform == 'win32'
-
             result = subprocess.run(
                 version_check_args,
                 capture_output=True,
                 text=True,
                 timeout=5,  # 5秒超时，避免长时间等待或交互式提示 | 5s timeout to avoid long wait or interactive prompts
-                shell=is_windows,
+                shell=_IS_WINDOWS,
                 stdin=subprocess.DEVNULL  # 关闭stdin，防止CLI工具等待输入 | Close stdin to prevent CLI tool waiting for input
             )
 
@@ -156,8 +226,8 @@ class CliReviewer:
             ui_process = await asyncio.create_subprocess_exec(
                 *ui_cmd_args,
                 stdin=asyncio.subprocess.DEVNULL,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,  # stdout是MCP的JSON通道，不能继承 | stdout is the MCP JSON channel, must not be inherited
+                stderr=None,  # 继承stderr，UI错误直接进入MCP日志（不使用PIPE，避免写满阻塞）| Inherit stderr so UI errors reach the MCP log (no PIPE, avoids blocking when full)
                 cwd=str(project_root)  # 设置工作目录 | Set working directory
             )
 
@@ -259,12 +329,19 @@ Please select an action:
             KeyError: 配置缺少必需字段 | Configuration missing required fields
 
         Side effects:
-            更新self.command_builder, self.display_name, self.log_file_name | Updates self.command_builder, self.display_name, self.log_file_name
+            配置变化时更新self.command_builder, self.display_name, self.log_file_name | Updates self.command_builder, self.display_name, self.log_file_name when config changed
         """
         config = get_current_config(project_root_path)
-        self.command_builder = CommandBuilder(config)
-        self.display_name = self.command_builder.get_display_name()
-        self.log_file_name = config["log_file_name"]
+        config_digest = self._config_digest_of(config)
+        if config_digest != self._config_digest:
+            # 配置已修改，重新构建 | Config changed, rebuild
+            self.command_builder = CommandBuilder(config)
+            self.display_name = self.command_builder.get_display_name()
+            self.log_file_name = config["log_file_name"]
+            self._config_digest = config_digest
+        else:
+            # 配置未修改，复用已有command_builder，仅重新检查安装状态 | Config unchanged, reuse command_builder and only re-check installation
+            logger.debug("[MCP] Configuration unchanged, reusing command builder")
         current_cli_tool = load_config(project_root_path).get("current_cli_tool", "iflow")
 
         version_check_args = self.command_builder.get_version_check_args()
@@ -307,16 +384,11 @@ Please select an action:
             print(f"\n[ERROR] {error_type}: {e}", file=sys.stderr)
             print("Please fix the configuration file and restart the review.", file=sys.stderr)
 
-        error_report = f"""# Review Report
-
-## Status
-error
-
-## Error Message
-Configuration Error: {str(e)}
-
-## Summary
-The configuration file (.VetMediatorSetting.json) {summary_detail}. Please check the file format and fix the issues.
+        error_report = self._generate_error_report(
+            report_path,
+            status="error",
+            error_message=f"Configuration Error: {str(e)}",
+            summary=f"""The configuration file (.VetMediatorSetting.json) {summary_detail}. Please check the file format and fix the issues.
 
 Error details:
 - {str(e)}
@@ -325,9 +397,8 @@ Configuration file locations (in priority order):
 1. {project_root_path}/.VetMediatorSetting.json
 2. ~/.VetMediatorSetting.json
 
-Please refer to .VetMediatorSetting.json.example for correct format.
-"""
-        report_path.write_text(error_report, encoding='utf-8')
+Please refer to .VetMediatorSetting.json.example for correct format."""
+        )
 
         return ReviewResult(
             status="failed",
@@ -355,35 +426,29 @@ Please refer to .VetMediatorSetting.json.example for correct format.
         Returns:
             str: 错误报告内容 | Error report content
         """
-        error_report = f"""# Review Report
-
-## Status
-error
-
-## Error Message
-{display_name} CLI tool not found: {version_or_error}
-
-## Summary
-{display_name} CLI is not available. The review was cancelled by the user or failed after multiple retry attempts.
+        summary = f"""{display_name} CLI is not available. The review was cancelled by the user or failed after multiple retry attempts.
 
 Please ensure {display_name} is installed and properly configured:
 """
 
         if install_cmd:
-            error_report += f"""
+            summary += f"""
 Installation command:
   {install_cmd}
 """
 
-        error_report += f"""
+        summary += f"""
 Configuration check:
   - Verify {display_name} is installed
   - Check PATH environment variable
-  - Verify .VetMediatorSetting.json configuration
-"""
+  - Verify .VetMediatorSetting.json configuration"""
 
-        report_path.write_text(error_report, encoding='utf-8')
-        return error_report
+        return self._generate_error_report(
+            report_path,
+            status="error",
+            error_message=f"{display_name} CLI tool not found: {version_or_error}",
+            summary=summary
+        )
 
     async def _cleanup_process(self, process, timeout=5):
         """优雅地清理进程及其子进程 | Gracefully cleanup process and its subprocesses
@@ -418,15 +483,34 @@ Configuration check:
         except ProcessLookupError:
             # 进程已不存在（可能已自然退出）| Process no longer exists (may have exited naturally)
             logger.info(f"[MCP] Process {process.pid} already exited")
-        except ProcessLookupError:
-            # 进程已不存在（可能已自然退出）| Process no longer exists (may have exited naturally)
-            logger.info(f"[MCP] Process {process.pid} already exited")
+
+    async def _finalize_log_task(self, log_task: asyncio.Task, timeout: float):
+        """等待日志捕获任务完成（读取剩余的stdout），超时则取消 | Wait for log capture task to complete (read remaining stdout), cancel on timeout
+
+        Args:
+            log_task: 日志捕获任务 | Log capture task
+            timeout: 等待超时（秒）| Wait timeout (seconds)
+        """
+        try:
+            await asyncio.wait_for(log_task, timeout=timeout)
+            logger.info("[MCP] Log capture task completed")
+        except asyncio.TimeoutError:
+            logger.warning("[MCP] Log capture task timeout, cancelling")
+            log_task.cancel()
+            try:
+                await log_task
+            except asyncio.CancelledError:
+                pass
+        except Exception as e:
+            logger.error(f"[MCP] Log capture task error: {str(e)}")
 
     async def _capture_and_write_log(self, stdout: asyncio.StreamReader, log_path: Path):
         """Capture CLI tool stdout in real-time, detect encoding, write to UTF-8 log.
 
         This replaces shell redirection (>) to achieve 100% control over log encoding.
-        Each line is decoded using smart encoding detection, then written as UTF-8.
+        Output is read in LOG_READ_CHUNK_SIZE chunks (not line by line) and split
+        into complete lines; each line is decoded using smart encoding detection,
+        then written as UTF-8.
 
         **IMPORTANT**: Log file is ALWAYS written in UTF-8 encoding (without BOM).
         This ensures consistent encoding across different platforms and CLI tools.
@@ -439,21 +523,255 @@ Configuration check:
             # IMPORTANT: Explicitly use UTF-8 encoding for log file
             # buffering=1 enables line buffering for real-time log viewing
             with open(log_path, 'w', encoding='utf-8', buffering=1) as f:
+                pending = b""  # Trailing partial line carried over to the next chunk
                 while True:
-                    # Read line as bytes
-                    line_bytes = await stdout.readline()
-                    if not line_bytes:
+                    # Read a chunk of bytes (one await per chunk instead of per line)
+                    chunk = await stdout.read(self.LOG_READ_CHUNK_SIZE)
+                    if not chunk:
                         break  # EOF
 
-                    # Smart decode (try UTF-8/GBK/GB18030)
-                    text = EncodingDetector.decode_bytes(line_bytes)
+                    data = pending + chunk
+                    cut = data.rfind(b"\n") + 1
+                    pending = data[cut:]
+                    if cut:
+                        # Write to UTF-8 log (no BOM)
+                        f.write(self._decode_log_lines(data[:cut]))
+
+                    # Record activity for the idle watchdog (replaces polling log mtime)
+                    self._last_log_write_ts = time.monotonic()
 
-                    # Write to UTF-8 log (no BOM)
-                    f.write(text)
+                if pending:
+                    # Output ended without a trailing newline
+                    f.write(EncodingDetector.decode_bytes(pending))
         except Exception as e:
             # Log capture failure should not crash the review workflow
             logger.error(f"[MCP] Log capture error: {str(e)}")
 
+    @staticmethod
+    def _decode_log_lines(data: bytes) -> str:
+        """Decode a block of complete lines from CLI stdout.
+
+        Fast path: if the whole block is valid UTF-8 every line in it is too
+        (newline bytes never occur inside a UTF-8 sequence), so decode it at
+        once. Otherwise fall back to smart per-line decoding, so a single
+        GBK line does not change how its neighbours are decoded.
+        """
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Smart decode (try UTF-8/GBK/GB18030)
+            lines = data.split(b"\n")[:-1]  # data ends with a newline
+            return "".join(EncodingDetector.decode_bytes(line + b"\n") for line in lines)
+
+    async def _watch_log_idle(self, idle_timeout: float) -> float:
+        """日志空闲看门狗：等待日志在idle_timeout秒内无新输出 | Log idle watchdog: wait until log has no new output for idle_timeout seconds
+
+        读取_capture_and_write_log维护的内存时间戳，无需访问log文件。| Reads the in-memory timestamp maintained by _capture_and_write_log, no log file access.
+
+        Args:
+            idle_timeout: 无响应超时（秒）| Idle timeout (seconds)
+
+        Returns:
+            float: 实际空闲时长（秒）| Actual idle duration (seconds)
+        """
+        while True:
+            idle_time = time.monotonic() - self._last_log_write_ts
+            if idle_time > idle_timeout:
+                return idle_time
+            # 睡眠到最早可能超时的时刻再重新检查 | Sleep until the earliest possible timeout, then re-check
+            await asyncio.sleep(idle_timeout - idle_time)
+
+    def _get_ready_report_size(self, report_path: Path) -> int:
+        """获取已就绪的report.md大小 | Get size of report.md once it is ready
+
+        Args:
+            report_path: report.md文件路径 | report.md file path
+
+        Returns:
+            int: 文件大小超过REPORT_MIN_SIZE_BYTES时返回大小，否则返回0 | File size if above REPORT_MIN_SIZE_BYTES, otherwise 0
+        """
+        try:
+            size = report_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+        return size if size > self.REPORT_MIN_SIZE_BYTES else 0
+
+    async def _watch_report(self, session_path: Path, report_path: Path) -> int:
+        """等待report.md生成（至少REPORT_MIN_SIZE_BYTES字节）| Wait for report.md to be generated (at least REPORT_MIN_SIZE_BYTES bytes)
+
+        优先使用watchfiles接收内核文件变化通知；watchfiles不可用时回退到按MAIN_LOOP_POLL_INTERVAL轮询。
+        Prefers kernel change notifications via watchfiles; falls back to polling every MAIN_LOOP_POLL_INTERVAL when unavailable.
+
+        Args:
+            session_path: Session目录路径 | Session directory path
+            report_path: report.md文件路径 | report.md file path
+
+        Returns:
+            int: 检测到的report.md大小 | Detected report.md size
+        """
+        size = self._get_ready_report_size(report_path)
+        if size:
+            return size
+
+        if awatch is not None:
+            try:
+                # yield_on_timeout定期唤醒，覆盖开始监听前已写入的情况 | yield_on_timeout wakes periodically to cover writes before watching started
+                async for _ in awatch(
+                    session_path,
+                    watch_filter=lambda change, path: Path(path).name == report_path.name,
+                    recursive=False,
+                    rust_timeout=5000,
+                    yield_on_timeout=True
+                ):
+                    size = self._get_ready_report_size(report_path)
+                    if size:
+                        return size
+            except Exception as e:
+                logger.warning(f"[MCP] File watcher unavailable, falling back to polling: {e}")
+
+        while True:
+            await asyncio.sleep(self.MAIN_LOOP_POLL_INTERVAL)
+            size = self._get_ready_report_size(report_path)
+            if size:
+                return size
+
+    async def _read_ui_server_message(self, server) -> Optional[Dict[str, Any]]:
+        """读取常驻UI进程输出的下一条JSON消息 | Read next JSON message from the persistent UI process
+
+        Args:
+            server: 常驻UI进程对象 | Persistent UI process object
+
+        Returns:
+            消息字典，进程输出结束时为None | Message dict, None when process output ended
+        """
+        while True:
+            line = await server.stdout.readline()
+            if not line:
+                return None
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(message, dict):
+                return message
+
+    async def _wait_ui_server_ready(self, server) -> bool:
+        """等待常驻UI进程回复ready（跳过上次审查遗留的事件消息）| Wait for ready reply from the persistent UI process (skip events left over from previous review)
+
+        Returns:
+            True表示窗口已显示，False表示进程已退出 | True if window shown, False if process exited
+        """
+        while True:
+            message = await self._read_ui_server_message(server)
+            if message is None:
+                return False
+            if message.get("status") == "ready":
+                return True
+
+    async def _wait_ui_server_abort(self, server) -> bool:
+        """等待常驻UI进程的用户中止事件 | Wait for user abort event from the persistent UI process
+
+        Returns:
+            True表示用户中止审查，False表示UI进程已退出 | True if user aborted review, False if UI process exited
+        """
+        while True:
+            message = await self._read_ui_server_message(server)
+            if message is None:
+                return False
+            if message.get("event") == "aborted":
+                return True
+
+    async def _show_in_ui_server(self, project_root_path: Path, log_path: Path, review_files: list):
+        """在常驻监控UI进程中显示本次审查 | Show this review in the persistent monitor UI process
+
+        进程不存在或已退出时按需启动。失败时返回None，由调用方回退到每次审查单独启动UI。
+        Starts the process on demand if missing or exited. Returns None on failure so the caller falls back to a per-review UI process.
+
+        Args:
+            project_root_path: 项目根目录路径 | Project root directory path
+            log_path: 日志文件路径 | Log file path
+            review_files: 审查文件路径列表 | Review file path list
+
+        Returns:
+            常驻UI进程对象，失败或被占用时为None | Persistent UI process object, None on failure or when in use
+        """
+        cls = type(self)
+        if cls._ui_server_busy:
+            # 另一个审查正在使用常驻UI | Another review is using the persistent UI
+            return None
+
+        # 在第一个await之前占用常驻UI，避免并发审查同时通过检查（重复启动或共用同一窗口）
+        # Claim the persistent UI before the first await so concurrent reviews cannot both pass the check
+        cls._ui_server_busy = True
+        ready = False
+
+        server = cls._ui_server_process
+        try:
+            if server is None or server.returncode is not None:
+                logger.info("[MCP] Starting persistent monitor UI process")
+                server = await asyncio.create_subprocess_exec(
+                    sys.executable,
+                    "-m",  # 使用模块方式运行 | Run as module
+                    "src.cli_monitor_ui",  # 模块路径 | Module path
+                    "--server",
+                    stdin=asyncio.subprocess.PIPE,  # 接收JSON命令 | Receives JSON commands
+                    stdout=asyncio.subprocess.PIPE,  # 输出JSON消息 | Emits JSON messages
+                    stderr=None,  # 继承stderr，UI错误直接进入MCP日志 | Inherit stderr so UI errors reach the MCP log
+                    cwd=str(project_root_path),
+                    close_fds=False
+                )
+                cls._ui_server_process = server
+
+            command = {
+                "command": "show",
+                "log_path": str(log_path),
+                "file_paths": review_files,
+                "tool_name": self.display_name,
+            }
+            server.stdin.write((json.dumps(command) + "\n").encode("utf-8"))
+            await server.stdin.drain()
+
+            if not await asyncio.wait_for(self._wait_ui_server_ready(server), timeout=self.UI_SERVER_READY_TIMEOUT):
+                raise RuntimeError("UI process exited before becoming ready")
+            ready = True
+
+        except Exception as e:
+            logger.warning(f"[MCP] Persistent monitor UI unavailable, falling back to per-review UI: {type(e).__name__}: {str(e)}")
+            await self._terminate_process(server, self.UI_TERMINATION_TIMEOUT, "persistent monitor UI")
+            cls._ui_server_process = None
+            return None
+
+        finally:
+            if not ready:
+                # 启动失败或被取消时释放占用 | Release the claim on failure or cancellation
+                cls._ui_server_busy = False
+
+        return server
+
+    async def _close_ui(self, ui_process, is_server: bool = False):
+        """关闭监控UI | Close monitor UI
+
+        常驻UI进程只关闭窗口（进程保留供下次审查复用），单次UI进程被终止。
+        For the persistent UI process only the window is closed (the process is kept for the next review); a per-review UI process is terminated.
+
+        Args:
+            ui_process: UI进程对象 | UI process object
+            is_server: 是否为常驻UI进程 | Whether it is the persistent UI process
+        """
+        if ui_process is None or ui_process.returncode is not None:
+            return
+
+        if is_server:
+            try:
+                ui_process.stdin.write((json.dumps({"command": "close"}) + "\n").encode("utf-8"))
+                await ui_process.stdin.drain()
+            except Exception as e:
+                logger.warning(f"[MCP] Failed to close persistent UI window: {str(e)}")
+                await self._terminate_process(ui_process, self.UI_TERMINATION_TIMEOUT, "persistent monitor UI")
+            return
+
+        await self._terminate_process(ui_process, self.UI_TERMINATION_TIMEOUT, "monitor UI")
+
     async def start_review(
         self,
         session_dir: str,
@@ -482,7 +800,7 @@ Configuration check:
             logger.warning("[MCP] No configuration file found")
 
             # 检查GUI是否可用 | Check if GUI is available
-            gui_available = check_gui_available()
+            gui_available = self._is_gui_available()
 
             if gui_available:
                 # GUI模式：启动配置检查UI | GUI mode: launch config check UI
@@ -518,8 +836,8 @@ Configuration check:
                     ui_process = await asyncio.create_subprocess_exec(
                         *ui_cmd_args,
                         stdin=asyncio.subprocess.DEVNULL,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.DEVNULL,  # stdout是MCP的JSON通道，不能继承 | stdout is the MCP JSON channel, must not be inherited
+                        stderr=None,  # 继承stderr，UI错误直接进入MCP日志 | Inherit stderr so UI errors reach the MCP log
                         cwd=str(project_root_path)  # 设置工作目录 | Set working directory
                     )
 
@@ -596,6 +914,7 @@ Configuration check:
             self.command_builder = CommandBuilder(config)
             self.display_name = self.command_builder.get_display_name()
             self.log_file_name = config["log_file_name"]
+            self._config_digest = self._config_digest_of(config)
         except ValueError as e:
             # 配置验证错误 - 快速失败（不应fallback）| Configuration validation error - fast fail (should not fallback)
             raise ValueError(f"Invalid configuration: {e}") from e
@@ -607,6 +926,7 @@ Configuration check:
             self.command_builder = CommandBuilder(config)
             self.display_name = "iflow"
             self.log_file_name = "iflow.log"
+            self._config_digest = None
 
         # [Modification 5]: 日志文件名 | Log file name
         report_path = session_path / "report.md"
@@ -626,7 +946,7 @@ Configuration check:
             current_cli_tool = load_config(project_root_path).get("current_cli_tool", "iflow")
 
             while True:
-                gui_available = check_gui_available()
+                gui_available = self._is_gui_available()
 
                 if gui_available:
                     exit_code = await self._launch_cli_check_ui(
@@ -726,28 +1046,22 @@ Configuration check:
             # 使用as_posix()转换为Unix风格路径（正斜杠），避免Windows反斜杠在shell中被转义 | Use as_posix() to convert to Unix-style path (forward slash), avoid Windows backslash being escaped in shell
             cli_cmd_args = self.command_builder.build_review_command_args(session_rel_path.as_posix())
 
-            # [Modification 10]: 检查prompt长度 | Check prompt length
+            # [Modification 10]: 检查prompt长度（超过阈值时由check_prompt_length记录警告）| Check prompt length (check_prompt_length logs the warning when over the limit)
             # 提取最后一个参数（prompt）| Extract last argument (prompt)
             if cli_cmd_args:
-                prompt = cli_cmd_args[-1]
-                if self.command_builder.check_prompt_length(prompt):
-                    max_len = config.get('max_prompt_length', 800)
-                    logger.warning(
-                        f"[MCP] Prompt length ({len(prompt)} chars) exceeds recommended limit "
-                        f"({max_len} chars). This may cause issues."
-                    )
+                self.command_builder.check_prompt_length(cli_cmd_args[-1])
 
             # [Modification 11]: 日志输出（用字符串形式）| Log output (as string format)
-            cli_cmd_str = self.command_builder.build_review_command_string(session_rel_path.as_posix())
+            # 由已构建的参数列表派生，保证日志与实际执行的命令一致 | Derived from the built args so the log matches the executed command
+            cli_cmd_str = shlex.join(cli_cmd_args)
             logger.info(f"[MCP] Executing {self.display_name} command: {cli_cmd_str}")
 
             # [Modification 12]: 在Windows上通过cmd.exe运行CLI工具 | Run CLI tool via cmd.exe on Windows
             # npm安装的CLI工具在Windows上通常是.cmd批处理文件 | npm-installed CLI tools on Windows are usually .cmd batch files
             # asyncio.create_subprocess_exec不能直接运行.cmd文件，必须通过cmd.exe调用 | asyncio.create_subprocess_exec cannot run .cmd files directly, must call via cmd.exe
             # cmd.exe可以处理.cmd/.bat/.exe等所有类型的可执行文件 | cmd.exe can handle all types of executables like .cmd/.bat/.exe
-            is_windows = sys.platform == 'win32'
-            if is_windows:
-                cli_cmd_args = ['cmd.exe', '/c'] + cli_cmd_args
+            if _IS_WINDOWS:
+                cli_cmd_args = [*_CMD_PREFIX, *cli_cmd_args]
                 logger.debug(f"[MCP] Running via cmd.exe on Windows")
 
             # [Modification 13]: 启动进程（使用subprocess_exec）| Start process (using subprocess_exec)
@@ -771,10 +1085,11 @@ Configuration check:
 
             # === 启动CLI进程后，检查并启动监控UI === | === After starting CLI process, check and start monitor UI ===
             ui_process = None
+            ui_is_server = False  # ui_process是否为常驻UI进程 | Whether ui_process is the persistent UI process
 
             # 检查GUI环境是否可用 | Check if GUI environment is available
             logger.info("[MCP] Checking GUI availability...")
-            gui_available = check_gui_available()
+            gui_available = self._is_gui_available()
             logger.info(f"[MCP] GUI available: {gui_available}")
 
             if gui_available:
@@ -784,95 +1099,127 @@ Configuration check:
                     ui_script = script_dir / "cli_monitor_ui.py"
 
                     logger.info(f"[MCP] UI script path: {ui_script}")
-                    logger.info(f"[MCP] UI script exists: {ui_script.exists()}")
+                    ui_script_exists = ui_script.exists()
+                    logger.info(f"[MCP] UI script exists: {ui_script_exists}")
 
-                    if not ui_script.exists():
+                    if not ui_script_exists:
                         logger.warning(f"[MCP] UI script not found at {ui_script}, skipping GUI")
                     else:
                         logger.info(f"[MCP] Launching GUI with Python: {sys.executable}")
                         logger.info(f"[MCP] Log path: {log_path}")
 
-                        # 收集session目录中的所有审查文件 | Collect all review files in session directory
+                        # 收集session目录中的所有审查文件（单次scandir）| Collect all review files in session directory (single scandir)
                         review_files = []
+                        with os.scandir(session_path) as it:
+                            entries = [
+                                e for e in it
+                                if e.name == "ReviewIndex.md" or (e.name.startswith("Task") and e.name.endswith(".md"))
+                            ]
 
                         # 1. 添加ReviewIndex.md | Add ReviewIndex.md
-                        review_index = session_path / "ReviewIndex.md"
-                        if review_index.exists():
-                            review_files.append(str(review_index))
+                        review_files.extend(e.path for e in entries if e.name == "ReviewIndex.md")
 
                         # 2. 添加所有Task*.md文件（按文件名排序）| Add all Task*.md files (sorted by filename)
-                        task_files = sorted(session_path.glob("Task*.md"))
-                        review_files.extend([str(f) for f in task_files])
+                        task_entries = [e for e in entries if e.name != "ReviewIndex.md"]
+                        task_entries.sort(key=lambda e: e.name)
+                        review_files.extend(e.path for e in task_entries)
 
                         logger.info(f"[MCP] Found {len(review_files)} review files for GUI")
 
-                        # 构建GUI启动参数（使用-m模块方式避免相对导入问题）| Build GUI launch arguments (use -m module mode to avoid relative import issues)
-                        ui_cmd_args = [
-                            sys.executable,  # Python解释器路径 | Python interpreter path
-                            "-m",  # 使用模块方式运行 | Run as module
-                            "src.cli_monitor_ui",  # 模块路径 | Module path
-                            "--log-path", str(log_path),
-                            "--tool-name", self.display_name,
-                        ]
-
-                        # 添加所有文件路径 | Add all file paths
-                        for file_path in review_files:
-                            ui_cmd_args.extend(["--file-path", file_path])
-
-                        # 启动UI子进程（设置工作目录为项目根目录）| Start UI subprocess (set working directory to project root)
-                        ui_process = await asyncio.create_subprocess_exec(
-                            *ui_cmd_args,
-                            stdin=asyncio.subprocess.DEVNULL,  # 避免继承父进程stdin | Avoid inheriting parent process stdin
-                            stdout=asyncio.subprocess.PIPE,  # 捕获输出用于调试 | Capture output for debugging
-                            stderr=asyncio.subprocess.PIPE,
-                            cwd=str(project_root_path)  # 设置工作目录为项目根目录 | Set working directory to project root
-                        )
-
-                        # 等待一小段时间，检查UI是否成功启动 | Wait a short time to check if UI started successfully
-                        await asyncio.sleep(0.5)
-
-                        if ui_process.returncode is not None:
-                            # UI进程已经退出（启动失败）| UI process already exited (startup failed)
-                            stdout, stderr = await ui_process.communicate()
-                            logger.error(f"[MCP] GUI failed to start (exit code: {ui_process.returncode})")
-                            logger.error(f"[MCP] GUI stdout: {stdout.decode('utf-8', errors='replace')}")
-                            logger.error(f"[MCP] GUI stderr: {stderr.decode('utf-8', errors='replace')}")
-                            ui_process = None
+                        # 优先复用常驻监控UI进程（避免每次审查重新启动Python解释器和Qt）| Prefer the persistent monitor UI process (avoids interpreter and Qt startup per review)
+                        ui_process = await self._show_in_ui_server(project_root_path, log_path, review_files)
+                        if ui_process is not None:
+                            ui_is_server = True
+                            logger.info(f"[MCP] GUI shown in persistent UI process (PID: {ui_process.pid})")
                         else:
-                            logger.info(f"[MCP] GUI started successfully (PID: {ui_process.pid})")
+                            # 构建GUI启动参数（使用-m模块方式避免相对导入问题）| Build GUI launch arguments (use -m module mode to avoid relative import issues)
+                            ui_cmd_args = [
+                                sys.executable,  # Python解释器路径 | Python interpreter path
+                                "-m",  # 使用模块方式运行 | Run as module
+                                "src.cli_monitor_ui",  # 模块路径 | Module path
+                                "--log-path", str(log_path),
+                                "--tool-name", self.display_name,
+                            ]
+
+                            # 添加所有文件路径 | Add all file paths
+                            for file_path in review_files:
+                                ui_cmd_args.extend(["--file-path", file_path])
+
+                            # 启动UI子进程（设置工作目录为项目根目录）| Start UI subprocess (set working directory to project root)
+                            # 注意：不要添加preexec_fn或user/group/extra_groups参数，否则CPython的_posixsubprocess无法使用vfork，
+                            # 会退化为复制父进程页表的fork（设置了cwd，posix_spawn本就不会被使用）| Note: do not add preexec_fn or user/group/extra_groups args,
+                            # otherwise CPython's _posixsubprocess cannot use vfork and falls back to fork copying the parent's page tables
+                            # (posix_spawn is never used here anyway because cwd is set)
+                            # close_fds=False：Python创建的fd默认不可继承（PEP 446），无需逐个关闭 | close_fds=False: Python fds are non-inheritable by default (PEP 446), no need to close them one by one
+                            ui_process = await asyncio.create_subprocess_exec(
+                                *ui_cmd_args,
+                                stdin=asyncio.subprocess.DEVNULL,  # 避免继承父进程stdin | Avoid inheriting parent process stdin
+                                stdout=asyncio.subprocess.DEVNULL,  # stdout是MCP的JSON通道，不能继承 | stdout is the MCP JSON channel, must not be inherited
+                                stderr=None,  # 继承stderr，UI错误直接进入MCP日志（不使用PIPE，避免长时间审查中写满阻塞）| Inherit stderr so UI errors reach the MCP log (no PIPE, avoids blocking when full during long reviews)
+                                cwd=str(project_root_path),  # 设置工作目录为项目根目录 | Set working directory to project root
+                                close_fds=False
+                            )
+
+                            # 不阻塞等待启动检查：启动失败由主循环的ui_wait_task感知 | No blocking startup check: a failed start is picked up by ui_wait_task in the main loop
+                            logger.info(f"[MCP] GUI started (PID: {ui_process.pid})")
 
                 except Exception as e:
                     # UI启动失败不影响主流程，继续执行 | UI startup failure doesn't affect main flow, continue execution
                     logger.error(f"[MCP] Exception while launching GUI: {type(e).__name__}: {str(e)}")
-                    import traceback
                     logger.error(f"[MCP] Traceback: {traceback.format_exc()}")
             else:
                 logger.info("[MCP] GUI not available, running in headless mode")
 
             # 主监控循环：等待进程退出或超时/UI中止 | Main monitor loop: wait for process exit or timeout/UI abort
+            # 事件驱动：同时等待CLI进程、UI进程和日志空闲看门狗，任一完成即唤醒 | Event-driven: wait on CLI process, UI process and log idle watchdog, wake on first completion
             start_time = time.monotonic()
             report_detected_time = None  # 首次检测到report.md的时间戳 | Timestamp when report.md first detected
 
             # 智能超时：监控log文件活跃度 | Smart timeout: monitor log file activity
-            last_log_mtime = 0  # 上次log文件修改时间 | Last log file modification time
-            last_activity_time = start_time  # 上次有活跃的时间 | Last activity time
             IDLE_TIMEOUT = 300  # 无响应超时：5分钟无新输出就终止 | Idle timeout: terminate after 5 minutes with no new output
 
+            self._last_log_write_ts = start_time
+            cli_wait_task = asyncio.create_task(process.wait(), name="cli")
+            if ui_process is None:
+                ui_wait_task = None
+            elif ui_is_server:
+                ui_wait_task = asyncio.create_task(self._wait_ui_server_abort(ui_process), name="ui")
+            else:
+                ui_wait_task = asyncio.create_task(ui_process.wait(), name="ui")
+            idle_task = asyncio.create_task(self._watch_log_idle(IDLE_TIMEOUT), name="idle")
+            report_task = asyncio.create_task(self._watch_report(session_path, report_path), name="report")
+
             try:
                 while True:
+                    # report.md检测前由report_task唤醒，检测后只等待倒计时剩余时间 | Before report.md detected report_task wakes the loop, afterwards wait only for remaining countdown
+                    if report_detected_time is None:
+                        wait_timeout = None
+                    else:
+                        wait_timeout = max(0, self.REPORT_DETECTION_WAIT_TIME - (time.monotonic() - report_detected_time))
+
+                    wait_set = {t for t in (cli_wait_task, ui_wait_task, idle_task) if t is not None}
+                    if not report_task.done():
+                        wait_set.add(report_task)
+                    done, _ = await asyncio.wait(
+                        wait_set,
+                        timeout=wait_timeout,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+
                     # ========================================
                     # 检查1：UI进程状态（最高优先级）| Check 1: UI process status (highest priority)
                     # ========================================
-                    if ui_process and ui_process.returncode is not None:
-                        # UI进程已退出 | UI process exited
-                        if ui_process.returncode == 99:
-                            # 退出码99：用户主动中止审查 | Exit code 99: user actively aborted review
+                    if ui_wait_task is not None and ui_wait_task in done:
+                        # UI进程已退出或发出中止事件 | UI process exited or emitted abort event
+                        user_aborted = ui_wait_task.result() if ui_is_server else ui_process.returncode == 99
+                        if user_aborted:
+                            # 中止事件或退出码99：用户主动中止审查 | Abort event or exit code 99: user actively aborted review
                             # 终止CLI进程 | Terminate CLI process
                             if process.returncode is None:
                                 await self._cleanup_process(process, timeout=2)
 
                             # 生成中止报告 | Generate abort report
-                            self._generate_error_report(
+                            error_report = self._generate_error_report(
                                 report_path,
                                 status="error",
                                 error_message="User aborted the review",
@@ -881,47 +1228,34 @@ Configuration check:
 
                             return ReviewResult(
                                 status="failed",
-                                report_content=self._read_report(report_path),
+                                report_content=error_report,
                                 log_tail=self._read_log_tail(log_path, 10),
                                 execution_time=int(time.time() - start_time),
                                 session_dir=session_dir
                             )
                         else:
-                            # 其他退出码：UI意外崩溃 | Other exit codes: UI crashed unexpectedly
+                            # 其他退出码：UI启动失败或意外崩溃 | Other exit codes: UI failed to start or crashed unexpectedly
                             # 不中止审查，继续等待CLI完成 | Don't abort review, continue waiting for CLI to complete
+                            if not ui_is_server:
+                                logger.error(f"[MCP] GUI exited unexpectedly (exit code: {ui_process.returncode})")
                             ui_process = None  # 清空引用，不再检查 | Clear reference, no longer check
+                            ui_wait_task = None
 
                     # ========================================
                     # 检查2：智能超时（基于log文件活跃度）| Check 2: Smart timeout (based on log file activity)
                     # ========================================
-                    elapsed = time.monotonic() - start_time
-
-                    # 检查log文件活跃度 | Check log file activity
-                    try:
-                        if log_path.exists():
-                            current_log_mtime = log_path.stat().st_mtime
-                            if current_log_mtime > last_log_mtime:
-                                # log文件有更新，重置活跃时间 | Log file updated, reset activity time
-                                last_log_mtime = current_log_mtime
-                                last_activity_time = time.monotonic()
-                                logger.debug(f"[MCP] Log file updated, reset activity timer")
-                    except Exception as e:
-                        logger.debug(f"[MCP] Failed to check log file: {e}")
-
-                    # 计算无响应时长 | Calculate idle duration
-                    idle_time = time.monotonic() - last_activity_time
-
-                    # 检查无响应超时（5分钟无新输出）| Check idle timeout (5 minutes with no new output)
-                    if idle_time > IDLE_TIMEOUT:
+                    if idle_task in done:
                         # CLI工具无响应超过5分钟，终止进程 | CLI tool no response for over 5 minutes, terminate process
+                        idle_time = idle_task.result()
+                        elapsed = time.monotonic() - start_time
+
                         await self._cleanup_process(process, timeout=2)
-                        if ui_process and ui_process.returncode is None:
-                            ui_process.kill()
+                        await self._close_ui(ui_process, ui_is_server)
 
                         await process.wait()
 
                         # 生成超时报告 | Generate timeout report
-                        self._generate_error_report(
+                        error_report = self._generate_error_report(
                             report_path,
                             status="timeout",
                             error_message=f"CLI tool has no response for {int(idle_time)} seconds (idle timeout: {IDLE_TIMEOUT}s)",
@@ -930,7 +1264,7 @@ Configuration check:
 
                         return ReviewResult(
                             status="timeout",
-                            report_content=self._read_report(report_path),
+                            report_content=error_report,
                             log_tail=self._read_log_tail(log_path, 10),
                             execution_time=int(elapsed),
                             session_dir=session_dir
@@ -941,70 +1275,56 @@ Configuration check:
                     # ========================================
                     # 如果report.md已生成且CLI进程未退出，等待10秒后强制终止 | If report.md generated and CLI process not exited, force terminate after 10s
                     # 要求文件至少100字节（避免误判空文件）| Require file at least 100 bytes (avoid false positive empty files)
-                    if report_path.exists() and report_path.stat().st_size > 100:
-                        if report_detected_time is None:
-                            # 首次检测到report.md | First detected report.md
-                            report_detected_time = time.monotonic()
-                            logger.info(f"[MCP] report.md detected ({report_path.stat().st_size} bytes), starting 10-second countdown")
-                        else:
-                            # 检查是否已等待超过10秒 | Check if waited for more than 10s
-                            report_wait_time = time.monotonic() - report_detected_time
-                            if report_wait_time > 10:
-                                # 超过10秒，先关闭UI（让用户有足够时间查看日志）| Over 10s, close UI first (give user enough time to view log)
-                                logger.info("[MCP] 10 seconds elapsed since report.md detected, closing UI")
-                                if ui_process and ui_process.returncode is None:
-                                    ui_process.kill()
-                                    try:
-                                        await asyncio.wait_for(ui_process.wait(), timeout=2)
-                                    except asyncio.TimeoutError:
-                                        pass
-
-                                # 然后检测CLI进程是否还在运行 | Then check if CLI process still running
-                                if process.returncode is None:
-                                    logger.info(f"[MCP] {self.display_name} process still running, force-terminating")
-                                    await self._cleanup_process(process, timeout=2)
-                                else:
-                                    logger.info(f"[MCP] {self.display_name} process already exited")
-
-                                # 跳出循环，进入正常结果读取流程 | Break loop, enter normal result reading flow
-                                break
+                    if report_task in done:
+                        # 首次检测到report.md | First detected report.md
+                        report_detected_time = time.monotonic()
+                        logger.info(f"[MCP] report.md detected ({report_task.result()} bytes), starting 10-second countdown")
+                    elif report_detected_time is not None:
+                        # 检测后只按时钟倒计时，不再stat文件（避免文件被截断时误判）| After detection count down by clock only, no more stat (avoids flip-flop on truncated file)
+                        # 检查是否已等待超过10秒 | Check if waited for more than 10s
+                        report_wait_time = time.monotonic() - report_detected_time
+                        if report_wait_time >= self.REPORT_DETECTION_WAIT_TIME:
+                            # 超过10秒，先关闭UI（让用户有足够时间查看日志）| Over 10s, close UI first (give user enough time to view log)
+                            logger.info("[MCP] 10 seconds elapsed since report.md detected, closing UI")
+                            await self._close_ui(ui_process, ui_is_server)
+
+                            # 然后检测CLI进程是否还在运行 | Then check if CLI process still running
+                            if process.returncode is None:
+                                logger.info(f"[MCP] {self.display_name} process still running, force-terminating")
+                                await self._cleanup_process(process, timeout=2)
+                            else:
+                                logger.info(f"[MCP] {self.display_name} process already exited")
+
+                            # 跳出循环，进入正常结果读取流程 | Break loop, enter normal result reading flow
+                            break
 
                     # ========================================
-                    # 检查4：等待进程退出（1秒超时）| Check 4: Wait for process exit (1s timeout)
+                    # 检查4：进程已退出 | Check 4: Process exited
                     # ========================================
-                    try:
-                        await asyncio.wait_for(process.wait(), timeout=1)
+                    if cli_wait_task in done:
                         # 进程已退出，跳出循环 | Process exited, break loop
                         break
-                    except asyncio.TimeoutError:
-                        # 进程还在运行，继续循环 | Process still running, continue loop
-                        continue
 
             finally:
-                # 清理CLI进程（确保所有退出路径都清理进程）| Cleanup CLI process (ensure all exit paths cleanup process)
-                await self._cleanup_process(process, timeout=3)
-
-                # 清理UI进程 | Cleanup UI process
-                if ui_process and ui_process.returncode is None:
-                    ui_process.kill()
-                    try:
-                        await asyncio.wait_for(ui_process.wait(), timeout=2)
-                    except asyncio.TimeoutError:
-                        pass
-
-                # 等待日志捕获任务完成（读取剩余的 stdout）| Wait for log capture task to complete (read remaining stdout)
+                # 取消仍在等待的监控任务 | Cancel monitor tasks still pending
+                for task in (cli_wait_task, ui_wait_task, idle_task, report_task):
+                    if task is not None and not task.done():
+                        task.cancel()
+
+                # 并发清理CLI进程、UI进程并等待日志捕获完成（确保所有退出路径都清理进程）
+                # Concurrently cleanup CLI process and UI process and wait for log capture (ensure all exit paths cleanup processes)
                 try:
-                    await asyncio.wait_for(log_task, timeout=5)
-                    logger.info("[MCP] Log capture task completed")
-                except asyncio.TimeoutError:
-                    logger.warning("[MCP] Log capture task timeout, cancelling")
-                    log_task.cancel()
-                    try:
-                        await log_task
-                    except asyncio.CancelledError:
-                        pass
-                except Exception as e:
-                    logger.error(f"[MCP] Log capture task error: {str(e)}")
+                    await asyncio.gather(
+                        self._cleanup_process(process, timeout=3),
+                        self._close_ui(ui_process, ui_is_server),
+                        self._finalize_log_task(log_task, timeout=5),
+                        return_exceptions=True
+                    )
+                finally:
+                    if ui_is_server:
+                        # 释放常驻UI供下次审查使用（清理期间再次被取消也必须释放）
+                        # Release persistent UI for the next review (even if cancelled again during cleanup)
+                        type(self)._ui_server_busy = False
 
             # 进程已退出，读取结果 | Process exited, read results
             # 场景判断：| Scenario determination:
@@ -1012,9 +1332,13 @@ Configuration check:
             # 场景2：report.md存在 + 无结束标记 → incomplete | Scenario 2: report.md exists + no completion marker → incomplete
             # 场景3：report.md不存在 → failed（生成错误报告）| Scenario 3: report.md doesn't exist → failed (generate error report)
 
-            # 场景3：检查report.md是否存在 | Scenario 3: Check if report.md exists
-            if not report_path.exists() or report_path.stat().st_size == 0:
-                self._generate_error_report(
+            # 场景3：检查report.md是否存在（单次stat，不存在时抛出FileNotFoundError）| Scenario 3: Check if report.md exists (single stat, raises FileNotFoundError when missing)
+            try:
+                report_size = report_path.stat().st_size
+            except FileNotFoundError:
+                report_size = 0
+            if report_size == 0:
+                error_report = self._generate_error_report(
                     report_path,
                     status="error",
                     error_message=f"{self.display_name} process exited without generating report (exit code {process.returncode})",
@@ -1022,7 +1346,7 @@ Configuration check:
                 )
                 return ReviewResult(
                     status="failed",
-                    report_content=self._read_report(report_path),
+                    report_content=error_report,
                     log_tail=self._read_log_tail(log_path, 10),
                     execution_time=int(time.time() - start_time),
                     session_dir=session_dir
@@ -1031,11 +1355,8 @@ Configuration check:
             # 场景1 & 2：report.md存在，读取内容并检查完整性 | Scenario 1 & 2: report.md exists, read content and check integrity
             report_content = self._read_report(report_path)
 
-            # 检查报告完整性标记 | Check report completion marker
-            has_completion_marker = ("<!-- REVIEW_COMPLETE -->" in report_content or
-                                     "---END_OF_REVIEW---" in report_content)
-
-            if not has_completion_marker:
+            # 检查报告完整性标记（只扫描报告尾部）| Check report completion marker (scans only the report tail)
+            if not ReportParser.has_completion_marker(report_content):
                 # 场景2：报告不完整（流式写入中断）| Scenario 2: Report incomplete (streaming write interrupted)
                 logger.warning(f"[MCP] Report is incomplete (missing completion marker)")
                 return ReviewResult(
@@ -1058,18 +1379,12 @@ Configuration check:
         except Exception as e:
 
             # 生成异常报告 | Generate exception report
-            exception_report = f"""# Review Report
-
-## Status
-error
-
-## Error Message
-{str(e)}
-
-## Summary
-An unexpected error occurred during the review process.
-"""
-            report_path.write_text(exception_report, encoding='utf-8')
+            exception_report = self._generate_error_report(
+                report_path,
+                status="error",
+                error_message=str(e),
+                summary="An unexpected error occurred during the review process."
+            )
 
             return ReviewResult(
                 status="failed",
@@ -1079,33 +1394,33 @@ An unexpected error occurred during the review process.
                 session_dir=session_dir
             )
 
-    def _get_log_line_count(self, log_path: Path) -> int:
-        """Get log file line count"""
-        if not log_path.exists():
-            return 0
-        try:
-            content = EncodingDetector.read_file(log_path)
-            return content.count('\n') + 1
-        except:
-            return 0
-
     def _read_log_tail(self, log_path: Path, lines: int) -> str:
-        """Read last N lines of log file"""
-        if not log_path.exists():
-            return ""
+        """Read last N lines of log file
+
+        Only the last LOG_TAIL_READ_BYTES are read, so the cost does not grow
+        with the log size. The log is always written as UTF-8 by
+        _capture_and_write_log.
+        """
         try:
-            content = EncodingDetector.read_file(log_path)
-            all_lines = content.splitlines()
+            size = log_path.stat().st_size
+            offset = max(0, size - self.LOG_TAIL_READ_BYTES)
+            with open(log_path, 'rb') as f:
+                f.seek(offset)
+                buf = f.read()
+            all_lines = buf.decode('utf-8', errors='replace').splitlines()
+            if offset > 0 and len(all_lines) > lines:
+                # First line may be cut in the middle
+                all_lines = all_lines[1:]
             return "\n".join(all_lines[-lines:])
         except:
             return ""
 
     def _read_report(self, report_path: Path) -> str:
         """Read report.md content"""
-        if not report_path.exists():
-            return ""
         try:
             return EncodingDetector.read_file(report_path)
+        except FileNotFoundError:
+            return ""
         except UnicodeDecodeError as e:
             return f"[ENCODING ERROR] Cannot read report.md: {str(e)}"
 
@@ -1115,7 +1430,7 @@ An unexpected error occurred during the review process.
         status: str,
         error_message: str,
         summary: str
-    ):
+    ) -> str:
         """生成并写入错误报告 | Generate and write error report
 
         Args:
@@ -1123,19 +1438,17 @@ An unexpected error occurred during the review process.
             status: 状态（error/timeout等）| Status (error/timeout, etc.)
             error_message: 错误消息 | Error message
             summary: 摘要说明 | Summary description
-        """
-        content = f"""# Review Report
-
-## Status
-{status}
-
-## Error Message
-{error_message}
 
-## Summary
-{summary}
-"""
+        Returns:
+            str: 错误报告内容（调用方直接使用，无需重新读取文件）| Error report content (callers use it directly instead of re-reading the file)
+        """
+        content = _ERROR_REPORT_TEMPLATE.format(
+            status=status,
+            error_message=error_message,
+            summary=summary
+        )
         report_path.write_text(content, encoding='utf-8')
+        return content
 
     async def _terminate_process(
         self,
@@ -1145,6 +1458,9 @@ An unexpected error occurred during the review process.
     ):
         """优雅终止异步进程 | Gracefully terminate async process
 
+        先terminate()（SIGTERM）让进程有机会清理，超过一半超时时间后再kill()。Windows上terminate()等同于kill()。
+        Sends terminate() (SIGTERM) first so the process can clean up, escalating to kill() after half the timeout. On Windows terminate() is the same as kill().
+
         Args:
             process: 异步进程对象 | Async process object
             timeout: 等待超时（秒），默认使用PROCESS_TERMINATION_TIMEOUT | Wait timeout (seconds), default uses PROCESS_TERMINATION_TIMEOUT
@@ -1155,9 +1471,17 @@ An unexpected error occurred during the review process.
 
         if process and process.returncode is None:
             logger.info(f"[MCP] Terminating {process_name}...")
-            process.kill()
             try:
-                await asyncio.wait_for(process.wait(), timeout=timeout)
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=timeout / 2)
+                except asyncio.TimeoutError:
+                    logger.warning(f"[MCP] {process_name} did not terminate, killing")
+                    process.kill()
+                    await asyncio.wait_for(process.wait(), timeout=timeout / 2)
+            except ProcessLookupError:
+                # 进程已不存在（可能已自然退出）| Process no longer exists (may have exited naturally)
+                pass
             except asyncio.TimeoutError:
                 logger.warning(f"[MCP] {process_name} termination timed out")
 
@@ -1175,16 +1499,11 @@ An unexpected error occurred during the review process.
         Returns:
             str: 错误报告内容 | Error report content
         """
-        error_report = f"""# Review Report
-
-## Status
-error
-
-## Error Message
-Configuration file missing
-
-## Summary
-No configuration file was found (.VetMediatorSetting.json). A default configuration has been created at:
+        return self._generate_error_report(
+            report_path,
+            status="error",
+            error_message="Configuration file missing",
+            summary=f"""No configuration file was found (.VetMediatorSetting.json). A default configuration has been created at:
 
 {created_config_path}
 
@@ -1198,7 +1517,5 @@ Required fields in each CLI tool preset:
 - executable: CLI tool executable name
 - args: Command line arguments
 - log_file_name: Log file name (relative path)
-- extended_prompt: (Optional) Additional prompt for the tool
-"""
-        report_path.write_text(error_report, encoding='utf-8')
-        return error_report
+- extended_prompt: (Optional) Additional prompt for the tool"""
+        )
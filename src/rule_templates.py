@@ -5,6 +5,9 @@ This module contains the complete content of all review rules as Python string c
 Rule content is embedded in the code during packaging, eliminating external file dependencies.
 """
 
+import hashlib
+from functools import lru_cache
+
 RULE_FILE_GENERATOR = """# CLI Tool Cross-Validation Review - File Generation Rules
 
 **Trigger Keywords**: `use vet validation` OR `let vet validate for me` OR `use CLI tool cross-validation`
@@ -455,6 +458,9 @@ RULE_TEMPLATES = {
     "file-generator": RULE_FILE_GENERATOR,
 }
 
+# Available rule types (RULE_TEMPLATES is constant, so computed once)
+_AVAILABLE_RULE_TYPES: tuple[str, ...] = tuple(RULE_TEMPLATES)
+
 
 def get_rule_content(rule_type: str = "file-generator") -> str:
     """Get rule content for specified type
@@ -471,6 +477,41 @@ def get_rule_content(rule_type: str = "file-generator") -> str:
     return RULE_TEMPLATES[rule_type]
 
 
-def get_available_rule_types() -> list[str]:
-    """Get list of all available rule types"""
-    return list(RULE_TEMPLATES.keys())
+@lru_cache(maxsize=None)
+def get_rule_content_bytes(rule_type: str = "file-generator") -> bytes:
+    """Get UTF-8 encoded rule content for specified type
+
+    Encoded lazily on first use and cached, so processes that never touch
+    the rule tools do not hold a second copy of the rule text.
+
+    Args:
+        rule_type: Rule type (default: file-generator)
+
+    Returns:
+        Rule content encoded as UTF-8 (without BOM)
+
+    Raises:
+        KeyError: If rule type does not exist
+    """
+    return RULE_TEMPLATES[rule_type].encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_rule_hash(rule_type: str = "file-generator") -> str:
+    """Get rule content hash for specified type (cached, templates are static)
+
+    Args:
+        rule_type: Rule type (default: file-generator)
+
+    Returns:
+        First 12 hex characters of the SHA-256 of the UTF-8 rule content
+
+    Raises:
+        KeyError: If rule type does not exist
+    """
+    return hashlib.sha256(get_rule_content_bytes(rule_type)).hexdigest()[:12]
+
+
+def get_available_rule_types() -> tuple[str, ...]:
+    """Get all available rule types"""
+    return _AVAILABLE_RULE_TYPES
@@ -1,17 +1,30 @@
 """CLI工具审查工作流的MCP服务器，提供完整的工作流管理。"""
 
 import os
+import re
 import sys
 import asyncio
-import hashlib
+import logging
+import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, List, Optional
 
 # Fix import path for both module and direct execution
 current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
+# 服务器进程的logging配置（输出到stderr，不影响MCP的stdout JSON通信）
+# reviewer在首次审查时才导入，不能依赖其导入时的basicConfig
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(levelname)s] %(message)s',
+    stream=sys.stderr
+)
+
 from mcp.server import InitializationOptions, NotificationOptions, Server
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel, Field
@@ -20,10 +33,16 @@ from mcp.server.stdio import stdio_server
 # Try relative import first, fallback to absolute
 try:
     from .workflow_manager import CliWorkflowManager
-    from .rule_templates import get_rule_content, get_available_rule_types
+    from .rule_templates import get_rule_content_bytes, get_rule_hash, get_available_rule_types
+    from .cli_config import load_config
 except ImportError:
     from workflow_manager import CliWorkflowManager
-    from rule_templates import get_rule_content, get_available_rule_types
+    from rule_templates import get_rule_content_bytes, get_rule_hash, get_available_rule_types
+    from cli_config import load_config
+
+
+# start_review返回的报告/日志默认最大字符数；客户端调大上限后，正文超过此长度时响应拆分为多个TextContent返回
+_REPORT_CHARS_LIMIT = 64 * 1024
 
 
 class StartReviewArgs(BaseModel):
@@ -45,6 +64,11 @@ class StartReviewArgs(BaseModel):
         default=None,
         description="TaskPlanning.md临时文件绝对路径（启用两阶段审查时推荐提供）"
     )
+    max_report_chars: int = Field(
+        default=_REPORT_CHARS_LIMIT,
+        ge=1,
+        description="响应中审查报告/日志的最大字符数，超出部分截断（完整报告保留在会话目录），默认65536"
+    )
 
 
 class ShowCliConfigArgs(BaseModel):
@@ -76,204 +100,326 @@ class UpdateReviewRulesArgs(BaseModel):
 # Initialize MCP server
 app = Server("vet-mediator-mcp")
 
-# workflow_manager will be created per-request with project_root
-
-
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """列出可用的MCP工具"""
-    return [
-        Tool(
-            name="start_review",
-            description=(
-                "启动CLI工具审查工作流：创建session目录、复制文件、启动CLI进程、监控进度、解析报告"
-            ),
-            inputSchema=StartReviewArgs.model_json_schema()
+# workflow_manager is cached per project_root (see _get_workflow_manager)
+
+# 状态标签映射（模块级只读常量，避免每次调用重建字典）
+# 解析后的审查状态 → 标签
+_PARSED_STATUS_EMOJI = MappingProxyType({
+    "approved": "[APPROVED]",
+    "major_issues": "[MAJOR_ISSUES]",
+    "minor_issues": "[MINOR_ISSUES]",
+    "incomplete": "[INCOMPLETE]"
+})
+# 执行状态 → 标签
+_EXEC_STATUS_EMOJI = MappingProxyType({
+    "completed": "[SUCCESS]",
+    "timeout": "[TIMEOUT]",
+    "failed": "[FAILED]",
+    "incomplete": "[INCOMPLETE]"
+})
+
+# show_cli_config启动配置界面的固定命令片段（使用-m模块方式）
+_CONFIG_UI_CMD_PREFIX = (sys.executable, "-m", "src.cli_check_ui")
+_CONFIG_UI_CMD_SUFFIX = ("--error-detail", "Configuration Management", "--config-mode")
+
+# 规则文件名：vet_mediator_rule_<12位十六进制hash>.md（不匹配backup等无关文件）
+_RULE_FILE_RE = re.compile(r"vet_mediator_rule_[0-9a-f]{12}\.md")
+
+
+def _truncate_text(text: str, max_chars: int) -> str:
+    """将文本截断到max_chars字符以内，并标注被截断的字符数"""
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}\n...[truncated {len(text) - max_chars} chars]"
+
+
+# 工具列表与参数schema不依赖任何输入，模块加载时构建一次
+_TOOLS: list[Tool] = [
+    Tool(
+        name="start_review",
+        description=(
+            "启动CLI工具审查工作流：创建session目录、复制文件、启动CLI进程、监控进度、解析报告"
         ),
-        Tool(
-            name="show_cli_config",
-            description=(
-                "显示CLI工具配置界面，允许用户查看所有配置工具的健康状态并切换当前激活的CLI工具"
-            ),
-            inputSchema=ShowCliConfigArgs.model_json_schema()
+        inputSchema=StartReviewArgs.model_json_schema()
+    ),
+    Tool(
+        name="show_cli_config",
+        description=(
+            "显示CLI工具配置界面，允许用户查看所有配置工具的健康状态并切换当前激活的CLI工具"
         ),
-        Tool(
-            name="get_review_rule_hash",
-            description=(
-                "获取审查规则文件的SHA-256 hash值（前12位），用于本地缓存版本检测。"
-                "AI代理可以通过hash判断本地缓存的规则文件是否是最新版本。"
-            ),
-            inputSchema=GetReviewRuleHashArgs.model_json_schema()
+        inputSchema=ShowCliConfigArgs.model_json_schema()
+    ),
+    Tool(
+        name="get_review_rule_hash",
+        description=(
+            "获取审查规则文件的SHA-256 hash值（前12位），用于本地缓存版本检测。"
+            "AI代理可以通过hash判断本地缓存的规则文件是否是最新版本。"
         ),
-        Tool(
-            name="update_review_rules",
-            description=(
-                "更新审查规则文件到指定目录。"
-                "MCP服务器会自动删除旧的规则缓存文件并写入最新版本。"
-                "规则文档包含：文件格式规范、模板、示例、MCP调用说明等。"
-            ),
-            inputSchema=UpdateReviewRulesArgs.model_json_schema()
-        )
-    ]
+        inputSchema=GetReviewRuleHashArgs.model_json_schema()
+    ),
+    Tool(
+        name="update_review_rules",
+        description=(
+            "更新审查规则文件到指定目录。"
+            "MCP服务器会自动删除旧的规则缓存文件并写入最新版本。"
+            "规则文档包含：文件格式规范、模板、示例、MCP调用说明等。"
+        ),
+        inputSchema=UpdateReviewRulesArgs.model_json_schema()
+    )
+]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """处理MCP工具调用
+@lru_cache(maxsize=8)
+def _get_workflow_manager(project_root: str) -> CliWorkflowManager:
+    """按项目根目录复用工作流管理器
+
+    CliWorkflowManager只保存路径，start_review的所有状态都是局部变量，
+    因此同一项目的并发审查可以安全共享同一实例。
+    """
+    return CliWorkflowManager(
+        base_dir="VetMediatorSessions",
+        project_root=project_root
+    )
+
+
+def _scan_rule_files(dst_dir: Path) -> list[tuple[str, str]]:
+    """创建目标目录并列出其中已有的规则文件 (文件名, 路径)"""
+    dst_dir.mkdir(parents=True, exist_ok=True)
+
+    # 单次scandir按文件名筛选规则文件（无需fnmatch和逐项构造Path）
+    with os.scandir(dst_dir) as entries:
+        return [
+            (entry.name, entry.path) for entry in entries
+            if _RULE_FILE_RE.fullmatch(entry.name)
+        ]
+
+
+def _write_rule_file_atomic(file_path: Path, content: bytes) -> None:
+    """先写入同目录临时文件再os.replace，读取方只会看到旧文件或完整的新文件
+
+    临时文件名每次调用唯一，同一目录的并发更新不会互相重命名对方的临时文件。
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=".vet_mediator_rule_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # mkstemp创建的文件权限为0600，恢复为普通文件权限供其他工具读取
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _unlink_rule_file(path: str) -> bool:
+    """删除单个规则文件；文件已被并发删除时返回False而不是报错"""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+async def _apply_rule_update(dst_path: str, content: bytes, hash_value: str) -> tuple[Path, list[str], bool]:
+    """将规则文件写入目标目录并删除旧的规则文件
+
+    文件名包含内容hash，如果目录中只有当前hash的规则文件，则已是最新版本，不重写。
+    新文件原子写入后才删除旧文件，任何时刻目录中都有完整的规则文件。
+    文件系统操作在工作线程中执行，旧文件并发删除（网络文件系统上每次unlink都是一次往返）。
 
     Args:
-        name: 工具名称（"start_review"、"show_cli_config"、"get_review_rule_hash"、"update_review_rules"）
-        arguments: 工具参数
+        dst_path: 目标目录
+        content: UTF-8编码的规则内容
+        hash_value: 规则内容hash（用于文件名）
 
     Returns:
-        包含结果的TextContent列表
+        (规则文件路径, 已删除的旧文件名列表, 是否写入了新文件)
     """
-    if name == "get_review_rule_hash":
-        args = GetReviewRuleHashArgs(**arguments)
-        try:
-            # 从内置模板获取规则内容并计算hash
-            content = get_rule_content(args.rule_type)
-            hash_value = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
-            return [TextContent(type="text", text=hash_value)]
-        except KeyError:
-            available_types = get_available_rule_types()
-            return [TextContent(
-                type="text",
-                text=f"[ERROR] Unknown rule type: {args.rule_type}. Available types: {', '.join(available_types)}"
-            )]
-        except Exception as e:
-            return [TextContent(type="text", text=f"[ERROR] Failed to calculate hash: {str(e)}")]
-
-    elif name == "update_review_rules":
-        args = UpdateReviewRulesArgs(**arguments)
-        try:
-            # Get rule content and hash
-            content = get_rule_content(args.rule_type)
-            hash_value = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+    dst_dir = Path(dst_path)
+    new_file_name = f"vet_mediator_rule_{hash_value}.md"
+    new_file_path = dst_dir / new_file_name
 
-            # Ensure target directory exists
-            dst_dir = Path(args.dst_path)
-            dst_dir.mkdir(parents=True, exist_ok=True)
+    existing_files = await asyncio.to_thread(_scan_rule_files, dst_dir)
 
-            # Delete all old rule files
-            deleted_files = []
-            for old_file in dst_dir.glob("vet_mediator_rule_*.md"):
-                deleted_files.append(str(old_file.name))
-                old_file.unlink()
+    # Already up to date: only the current rule file exists
+    if [name for name, _ in existing_files] == [new_file_name]:
+        return new_file_path, [], False
 
-            # Write new rule file with UTF-8 without BOM
-            new_file_path = dst_dir / f"vet_mediator_rule_{hash_value}.md"
-            new_file_path.write_text(content, encoding='utf-8')
+    # Write new rule file atomically with UTF-8 without BOM (exact bytes that were hashed)
+    await asyncio.to_thread(_write_rule_file_atomic, new_file_path, content)
 
-            # Build success message
-            success_msg = f"[SUCCESS] Rule file updated successfully\n\n"
-            success_msg += f"File: {new_file_path}\n"
-            success_msg += f"Hash: {hash_value}\n"
-            if deleted_files:
-                success_msg += f"Deleted old files: {', '.join(deleted_files)}\n"
-
-            return [TextContent(type="text", text=success_msg)]
-
-        except KeyError:
-            available_types = get_available_rule_types()
-            return [TextContent(
-                type="text",
-                text=f"[ERROR] Unknown rule type: {args.rule_type}. Available types: {', '.join(available_types)}"
-            )]
-        except Exception as e:
-            return [TextContent(type="text", text=f"[ERROR] Failed to update rules: {str(e)}")]
-
-    elif name == "start_review":
-        args = StartReviewArgs(**arguments)
-
-        # Create workflow_manager instance with project_root
-        workflow_manager = CliWorkflowManager(
-            base_dir="VetMediatorSessions",
-            project_root=args.project_root
+    # Delete all old rule files concurrently
+    stale_files = [(name, path) for name, path in existing_files if name != new_file_name]
+    deleted_files = []
+    if stale_files:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_unlink_rule_file, path) for _, path in stale_files)
         )
+        deleted_files = [name for (name, _), deleted in zip(stale_files, results) if deleted]
 
-        # Start review workflow
-        try:
-            result = await workflow_manager.start_review(
-                review_index_path=args.review_index_path,
-                draft_paths=args.draft_paths,
-                max_iterations=args.max_iterations,
-                initiator=args.initiator,
-                original_requirement_path=args.original_requirement_path,
-                task_planning_path=args.task_planning_path
-            )
+    return new_file_path, deleted_files, True
 
-            # Format result as text response
-            # If review completed and parsed, use parsed status; otherwise use execution status
-            if result.parsed:
-                review_status = result.parsed.status
-                status_emoji = {
-                    "approved": "[APPROVED]",
-                    "major_issues": "[MAJOR_ISSUES]",
-                    "minor_issues": "[MINOR_ISSUES]",
-                    "incomplete": "[INCOMPLETE]"
-                }.get(review_status, "[UNKNOWN]")
-            else:
-                review_status = result.status
-                status_emoji = {
-                    "completed": "[SUCCESS]",
-                    "timeout": "[TIMEOUT]",
-                    "failed": "[FAILED]",
-                    "incomplete": "[INCOMPLETE]"
-                }.get(review_status, "[UNKNOWN]")
-
-            response_text = f"""{status_emoji} Review {review_status}
-
-**Execution Time**: {result.execution_time} seconds
-**Session Directory**: {result.session_dir or 'N/A'}
-
-**Review Report**:
-{result.report_content}
-
-**Review Log (last 10 lines)**:
-{result.log_tail}
-"""
-            return [TextContent(type="text", text=response_text)]
 
-        except Exception as e:
-            error_text = f"[ERROR] Review workflow failed: {str(e)}"
-            return [TextContent(type="text", text=error_text)]
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """列出可用的MCP工具"""
+    return _TOOLS
+
+
+async def _handle_get_review_rule_hash(arguments: Any) -> list[TextContent]:
+    """处理get_review_rule_hash：返回规则文件hash"""
+    # 客户端频繁轮询此工具：唯一参数是字符串时直接读取，跳过Pydantic模型构建
+    rule_type = arguments.get("rule_type", "file-generator")
+    if not isinstance(rule_type, str):
+        # 非法参数仍交给Pydantic生成校验错误
+        rule_type = GetReviewRuleHashArgs(**arguments).rule_type
+    try:
+        # 获取内置模板的规则hash（首次计算后缓存）
+        hash_value = get_rule_hash(rule_type)
+        return [TextContent(type="text", text=hash_value)]
+    except KeyError:
+        available_types = get_available_rule_types()
+        return [TextContent(
+            type="text",
+            text=f"[ERROR] Unknown rule type: {rule_type}. Available types: {', '.join(available_types)}"
+        )]
+    except Exception as e:
+        return [TextContent(type="text", text=f"[ERROR] Failed to calculate hash: {str(e)}")]
+
+
+async def _handle_update_review_rules(arguments: Any) -> list[TextContent]:
+    """处理update_review_rules：更新规则文件到目标目录"""
+    args = UpdateReviewRulesArgs(**arguments)
+    try:
+        # Get rule content (pre-encoded UTF-8) and hash (both cached)
+        content = get_rule_content_bytes(args.rule_type)
+        hash_value = get_rule_hash(args.rule_type)
+
+        # Filesystem work runs in worker threads so slow disks do not block the event loop
+        new_file_path, deleted_files, updated = await _apply_rule_update(
+            args.dst_path, content, hash_value
+        )
 
-    elif name == "show_cli_config":
-        args = ShowCliConfigArgs(**arguments)
+        # Build success message
+        if updated:
+            success_msg = f"[SUCCESS] Rule file updated successfully\n\n"
+        else:
+            success_msg = f"[SUCCESS] Rule file is already up to date\n\n"
+        success_msg += f"File: {new_file_path}\n"
+        success_msg += f"Hash: {hash_value}\n"
+        if deleted_files:
+            success_msg += f"Deleted old files: {', '.join(deleted_files)}\n"
+
+        return [TextContent(type="text", text=success_msg)]
+
+    except KeyError:
+        available_types = get_available_rule_types()
+        return [TextContent(
+            type="text",
+            text=f"[ERROR] Unknown rule type: {args.rule_type}. Available types: {', '.join(available_types)}"
+        )]
+    except Exception as e:
+        return [TextContent(type="text", text=f"[ERROR] Failed to update rules: {str(e)}")]
+
+
+async def _handle_start_review(arguments: Any) -> list[TextContent]:
+    """处理start_review：执行完整审查工作流并格式化结果"""
+    args = StartReviewArgs(**arguments)
+
+    # Get workflow_manager instance for project_root
+    workflow_manager = _get_workflow_manager(args.project_root)
+
+    # Start review workflow
+    try:
+        result = await workflow_manager.start_review(
+            review_index_path=args.review_index_path,
+            draft_paths=args.draft_paths,
+            max_iterations=args.max_iterations,
+            initiator=args.initiator,
+            original_requirement_path=args.original_requirement_path,
+            task_planning_path=args.task_planning_path
+        )
 
-        try:
-            # Load current configuration
-            try:
-                from .cli_config import load_config
-            except ImportError:
-                from cli_config import load_config
-
-            config = load_config(Path(args.project_root))
-            current_tool = config.get("current_cli_tool", "iflow")
-
-            # Launch GUI in background (using -m module mode)
-            import subprocess
-            ui_cmd = [
-                sys.executable,
-                "-m",
-                "src.cli_check_ui",
-                "--project-root", args.project_root,
-                "--current-tool", current_tool,
-                "--error-detail", "Configuration Management",
-                "--config-mode"
+        # Format result as text response
+        # If review completed and parsed, use parsed status; otherwise use execution status
+        if result.parsed:
+            review_status = result.parsed.status
+            status_emoji = _PARSED_STATUS_EMOJI.get(review_status, "[UNKNOWN]")
+        else:
+            review_status = result.status
+            status_emoji = _EXEC_STATUS_EMOJI.get(review_status, "[UNKNOWN]")
+
+        # 限制返回给客户端的报告/日志大小（完整内容保留在会话目录中）
+        report_content = _truncate_text(result.report_content, args.max_report_chars)
+        log_tail = _truncate_text(result.log_tail, args.max_report_chars)
+
+        # 按片段组装响应（报告正文原样插入）
+        header_parts = [
+            f"{status_emoji} Review {review_status}",
+            "",
+            f"**Execution Time**: {result.execution_time} seconds",
+            f"**Session Directory**: {result.session_dir or 'N/A'}",
+            "",
+            "**Review Report**:",
+        ]
+        footer_parts = [
+            "**Review Log (last 10 lines)**:",
+            log_tail,
+            "",
+        ]
+
+        # 返回的正文长度（不含截断标记）；默认上限下截断后不会超过阈值，仅客户端调大上限时才拆分
+        if min(len(result.report_content), args.max_report_chars) > _REPORT_CHARS_LIMIT:
+            # 大报告：正文单独作为一个TextContent，不再拼接到完整响应中复制一遍
+            return [
+                TextContent(type="text", text="\n".join(header_parts)),
+                TextContent(type="text", text=report_content),
+                TextContent(type="text", text="\n".join(footer_parts)),
             ]
 
-            # Start background process
-            subprocess.Popen(
-                ui_cmd,
-                cwd=args.project_root,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+        response_text = "\n".join(header_parts + [report_content, ""] + footer_parts)
+        return [TextContent(type="text", text=response_text)]
+
+    except Exception as e:
+        error_text = f"[ERROR] Review workflow failed: {str(e)}"
+        return [TextContent(type="text", text=error_text)]
+
 
-            response_text = f"""[INFO] CLI Configuration Window Opened
+async def _handle_show_cli_config(arguments: Any) -> list[TextContent]:
+    """处理show_cli_config：在后台打开CLI配置界面"""
+    args = ShowCliConfigArgs(**arguments)
+
+    try:
+        # Load current configuration
+        config = load_config(Path(args.project_root))
+        current_tool = config.get("current_cli_tool", "iflow")
+
+        # Launch GUI in background (using -m module mode)
+        ui_cmd = (
+            *_CONFIG_UI_CMD_PREFIX,
+            "--project-root", args.project_root,
+            "--current-tool", current_tool,
+            *_CONFIG_UI_CMD_SUFFIX
+        )
+
+        # Start background process (in a worker thread so fork/exec does not block the event loop)
+        # start_new_session: 配置窗口独立于MCP进程的会话，不会收到发给服务器的SIGINT（Windows上忽略）
+        # close_fds=False: Python创建的fd默认不可继承（PEP 446），无需逐个关闭
+        await asyncio.to_thread(
+            subprocess.Popen,
+            ui_cmd,
+            cwd=args.project_root,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=False
+        )
+
+        response_text = f"""[INFO] CLI Configuration Window Opened
 
 Current Active Tool: {current_tool}
 Project Root: {args.project_root}
@@ -287,14 +433,37 @@ You can:
 
 Note: Changes made in the configuration window will take effect immediately.
 """
-            return [TextContent(type="text", text=response_text)]
+        return [TextContent(type="text", text=response_text)]
+
+    except Exception as e:
+        error_text = f"[ERROR] Failed to open CLI configuration window: {str(e)}"
+        return [TextContent(type="text", text=error_text)]
+
+
+# 工具名 → 处理函数（单次字典查找分发）
+_TOOL_HANDLERS: dict[str, Callable[[Any], Awaitable[list[TextContent]]]] = {
+    "get_review_rule_hash": _handle_get_review_rule_hash,
+    "update_review_rules": _handle_update_review_rules,
+    "start_review": _handle_start_review,
+    "show_cli_config": _handle_show_cli_config,
+}
 
-        except Exception as e:
-            error_text = f"[ERROR] Failed to open CLI configuration window: {str(e)}"
-            return [TextContent(type="text", text=error_text)]
 
-    else:
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """处理MCP工具调用
+
+    Args:
+        name: 工具名称（"start_review"、"show_cli_config"、"get_review_rule_hash"、"update_review_rules"）
+        arguments: 工具参数
+
+    Returns:
+        包含结果的TextContent列表
+    """
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 
 async def async_main():
@@ -316,6 +485,13 @@ async def async_main():
 
 def main():
     """同步入口（由uv调用）"""
+    # 可选依赖：uvloop（libuv事件循环，加快stdio读写和子进程管理，仅POSIX）
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(async_main())
 
 
@@ -1,33 +1,91 @@
 """CLI工具审查流程的工作流管理器。"""
 
 import os
+import heapq
+import itertools
+import logging
 import shutil
 import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+# file_generator/reviewer/report_parser在首次start_review时才导入（缩短MCP服务器启动时间）
 try:
-    from .file_generator import FileGenerator
-    from .reviewer import CliReviewer
-    from .report_parser import ReportParser
     from .data_models import ReviewResult, ParsedReport
-    from .cli_config import get_current_config
+    from .cli_config import get_current_config, get_user_config_path, get_legacy_config_path
     from .command_builder import CommandBuilder
 except ImportError:
-    from file_generator import FileGenerator
-    from reviewer import CliReviewer
-    from report_parser import ReportParser
     from data_models import ReviewResult, ParsedReport
-    from cli_config import get_current_config
+    from cli_config import get_current_config, get_user_config_path, get_legacy_config_path
     from command_builder import CommandBuilder
 
 
+logger = logging.getLogger(__name__)
+
+# 后台清理任务的强引用集合（防止任务在完成前被垃圾回收）
+_BACKGROUND_TASKS: set = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """后台任务完成回调：释放强引用并记录未处理的异常"""
+    _BACKGROUND_TASKS.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning(f"[Workflow] Background session cleanup failed: {exc!r}")
+
+
+# session目录序号（同一秒内启动的多个审查各自获得独立目录）
+_SESSION_SEQ = itertools.count(1)
+
+
+def _config_stamp(project_root: Path) -> tuple:
+    """配置文件的修改时间戳（不存在时为None），用作配置缓存键的一部分
+
+    配置由独立的配置界面进程修改，因此按文件mtime判断缓存是否失效。
+    """
+    stamp = []
+    for path in (get_legacy_config_path(), get_user_config_path(), project_root / ".VetMediatorSetting.json"):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+@lru_cache(maxsize=8)
+def _load_config_and_builder(project_root: str, stamp: tuple) -> tuple:
+    """加载当前CLI配置并构造CommandBuilder（按项目根目录和配置文件mtime缓存）
+
+    Args:
+        project_root: 项目根目录
+        stamp: _config_stamp()返回的配置文件时间戳（配置文件变化时缓存失效）
+
+    Returns:
+        (配置字典, CommandBuilder实例)；二者在并发审查间共享，不得修改
+    """
+    config = get_current_config(Path(project_root))
+    return config, CommandBuilder(config)
+
+
 class CliWorkflowManager:
-    """管理完整的CLI工具审查工作流。"""
+    """管理完整的CLI工具审查工作流。
+
+    server按project_root缓存并共享同一实例，并发的start_review调用会同时使用它。
+    实例属性只能保存不可变的项目级配置；每次审查的状态必须保持为局部变量。
+    """
+
+    # 实例只有固定的路径属性，不需要__dict__
+    __slots__ = ("project_root", "base_dir", "_project_root_str")
 
     # Session management constants
     DEFAULT_KEEP_SESSIONS = 10  # 保留最近N个session
+    CLEANUP_WORKERS = 4  # 并行删除旧session的线程数
 
     def __init__(self, base_dir: str = "VetMediatorSessions", project_root: str = None):
         """初始化工作流管理器。
@@ -41,6 +99,8 @@ class CliWorkflowManager:
 
         self.project_root = Path(project_root)
         self.base_dir = self.project_root / base_dir
+        # 字符串形式只计算一次，供每次审查复用
+        self._project_root_str = str(self.project_root)
 
     async def start_review(
         self,
@@ -64,18 +124,30 @@ class CliWorkflowManager:
         Returns:
             ReviewResult instance with review data and parsed report
         """
+        # 审查相关模块延迟导入（sys.modules缓存，仅首次调用时加载）
+        try:
+            from .file_generator import FileGenerator
+            from .reviewer import CliReviewer
+            from .report_parser import ReportParser
+        except ImportError:
+            from file_generator import FileGenerator
+            from reviewer import CliReviewer
+            from report_parser import ReportParser
+
         # 1. 创建session目录
-        session_dir = self._create_session_dir()
+        session_dir = await self._create_session_dir()
 
         try:
             # 2. 提前加载config获取审阅者名称
-            config = get_current_config(self.project_root)
-            command_builder = CommandBuilder(config)
+            config, command_builder = _load_config_and_builder(
+                self._project_root_str, _config_stamp(self.project_root)
+            )
             reviewer = command_builder.get_display_name()
 
-            # 3. 复制所有文件到session目录
+            # 3. 复制所有文件到session目录（在工作线程中执行，不阻塞事件循环；旧session清理同时在后台进行）
             file_gen = FileGenerator(session_dir, project_root=self.project_root)
-            review_file, task_files = file_gen.copy_files_to_session(
+            review_file, task_files = await asyncio.to_thread(
+                file_gen.copy_files_to_session,
                 review_index_path,
                 draft_paths,
                 initiator=initiator,
@@ -88,39 +160,27 @@ class CliWorkflowManager:
             cli_reviewer = CliReviewer()
             result = await cli_reviewer.start_review(
                 session_dir=str(session_dir),
-                project_root=str(self.project_root)
+                project_root=self._project_root_str
             )
 
-            # 5. 解析report.md并重新构造ReviewResult（dataclass不可变）
+            # 5. 解析report.md，仅替换变化的字段
             # 只要report.md存在且有内容，就尝试解析（不管进程退出码）
-            if result.report_content and result.report_content.strip():
+            # isspace()不像strip()那样复制整个报告
+            if result.report_content and not result.report_content.isspace():
                 parsed = ReportParser.parse_report(result.report_content)
-                # 重新构造ReviewResult，使用parsed的status
-                result = ReviewResult(
-                    status=parsed.status,
-                    report_content=result.report_content,
-                    log_tail=result.log_tail,
-                    execution_time=result.execution_time,
-                    parsed=parsed,
-                    session_dir=result.session_dir
-                )
-            else:
-                # 报告不存在或为空，保持原始status
-                result = ReviewResult(
+                # 使用parsed的status
+                return dataclasses.replace(result, status=parsed.status, parsed=parsed)
+
+            # 报告不存在或为空，保持原始status
+            return dataclasses.replace(
+                result,
+                parsed=ParsedReport(
                     status=result.status,
-                    report_content=result.report_content,
-                    log_tail=result.log_tail,
-                    execution_time=result.execution_time,
-                    parsed=ParsedReport(
-                        status=result.status,
-                        issues=[],
-                        suggestions=[],
-                        raw_content=result.report_content or ""
-                    ),
-                    session_dir=result.session_dir
+                    issues=[],
+                    suggestions=[],
+                    raw_content=result.report_content or ""
                 )
-
-            return result
+            )
 
         except Exception as e:
             return ReviewResult(
@@ -143,41 +203,70 @@ class CliWorkflowManager:
         Args:
             keep_count: 保留最近N个session目录（默认10个）
         """
-        if not self.base_dir.exists():
+        # 获取所有session目录（scandir的is_dir来自目录项类型，无需stat）
+        # Get all session directories (scandir: is_dir uses the entry type, no stat)
+        try:
+            with os.scandir(self.base_dir) as it:
+                session_entries = [e for e in it if e.name.startswith("session-") and e.is_dir()]
+        except FileNotFoundError:
             return
 
-        # 获取所有session目录 | Get all session directories
-        session_dirs = [d for d in self.base_dir.iterdir() if d.is_dir() and d.name.startswith("session-")]
-
-        # 按修改时间排序（最新的在前）| Sort by modification time (newest first)
-        session_dirs.sort(key=lambda d: d.stat().st_mtime, reverse=True)
+        # 常见情况：数量未超出，无需stat任何目录 | Common case: within limit, skip all stats
+        if len(session_entries) <= keep_count:
+            return
 
-        # 删除超出保留数量的旧session | Delete old sessions beyond keep count
-        for old_session in session_dirs[keep_count:]:
+        # 超出时才读取修改时间；并发清理可能已删除部分目录，跳过即可
+        # Read mtimes only when over the limit; skip dirs removed by a concurrent cleanup
+        entries = []
+        for e in session_entries:
             try:
-                shutil.rmtree(old_session)
-            except Exception:
-                pass  # 忽略删除失败的情况 | Ignore deletion failures
+                entries.append((e.stat().st_mtime, e.path))
+            except OSError:
+                continue
+
+        # 只选出最新的N个，无需整体排序 | Select the newest N without a full sort
+        keep = {d for _, d in heapq.nlargest(keep_count, entries, key=lambda e: e[0])}
+
+        # 删除超出保留数量的旧session（忽略删除失败）| Delete old sessions beyond keep count (ignore failures)
+        to_delete = [path for _, path in entries if path not in keep]
+        if len(to_delete) == 1:
+            shutil.rmtree(to_delete[0], ignore_errors=True)
+            return
 
-    def _create_session_dir(self) -> Path:
+        # 多个目录并行删除（unlink/rmdir释放GIL，可重叠文件系统延迟）| Delete in parallel threads
+        with ThreadPoolExecutor(max_workers=self.CLEANUP_WORKERS) as executor:
+            for path in to_delete:
+                executor.submit(shutil.rmtree, path, ignore_errors=True)
+
+    async def _create_session_dir(self) -> Path:
         """创建session目录 | Create session directory
 
+        旧session清理在后台线程执行，不阻塞本次审查启动。
+        目录名带进程内递增序号，并以exist_ok=False创建，并发审查不会共用同一目录。
+
         Returns:
             创建的session目录路径 | Created session directory path
         """
-        # 清理旧的session目录（保留最近10个）| Cleanup old session directories (keep most recent 10)
-        self._cleanup_old_sessions(keep_count=self.DEFAULT_KEEP_SESSIONS)
+        # 后台清理旧的session目录（保留最近10个）| Cleanup old session directories in background (keep most recent 10)
+        cleanup_task = asyncio.create_task(
+            asyncio.to_thread(self._cleanup_old_sessions, self.DEFAULT_KEEP_SESSIONS)
+        )
+        _BACKGROUND_TASKS.add(cleanup_task)
+        cleanup_task.add_done_callback(_on_background_task_done)
 
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
 
-        # Directory path: VetMediatorSessions/session-{timestamp}/
-        session_dir = self.base_dir / f"session-{timestamp}"
+        while True:
+            # Directory path: VetMediatorSessions/session-{timestamp}-{seq}/
+            session_dir = self.base_dir / f"session-{timestamp}-{next(_SESSION_SEQ):04d}"
 
-        # Create directory
-        session_dir.mkdir(parents=True, exist_ok=True)
-
-        return session_dir
+            # Create directory (off the event loop)
+            try:
+                await asyncio.to_thread(session_dir.mkdir, parents=True)
+                return session_dir
+            except FileExistsError:
+                continue  # 名称已被其他服务器进程占用，取下一个序号
 
     def cleanup_session(self, session_dir: str) -> bool:
         """清理session目录
@@ -189,7 +278,6 @@ class CliWorkflowManager:
             True表示清理成功，False表示失败
         """
         try:
-            import shutil
             shutil.rmtree(session_dir)
             return True
         except Exception: